@@ -0,0 +1,34 @@
+"""
+Gunicorn settings for serving the RAG API (``rag_system.api:app``).
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Requests spend almost all their time waiting on OpenAI, so each worker serves many
+# of them concurrently on greenlets. The selected strategy and template are
+# per-process state, so keep one worker (WEB_CONCURRENCY) unless that is acceptable.
+worker_class = "gevent"
+worker_connections = 100
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+timeout = 120
+
+# Import the app, and load the vector index, once in the master so workers share it
+preload_app = True
+
+
+def when_ready(server):
+    # Only the index and docstore: API clients (and their SSL contexts) are created in
+    # each worker, after gevent has patched ssl and sockets
+    from rag_system.store import load_index
+
+    load_index()
+
+
+def post_worker_init(worker):
+    # Session logging runs a listener thread, which does not survive fork(), so the
+    # chain and its session are set up in each worker after gevent has patched it
+    from rag_system.api import initialize_rag_chain
+
+    initialize_rag_chain()
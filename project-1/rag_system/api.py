@@ -0,0 +1,401 @@
+import atexit
+import os
+import logging
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from time import monotonic_ns
+from typing import Any, Optional
+from flask import Flask, Response, g, request, jsonify, send_from_directory, stream_with_context
+from flask_cors import CORS
+
+from rag_system.config_loader import get_app_config, get_prompt_config
+from rag_system.config import BASE_DIR, LOG_DIR, RESPONSE_CACHE_PATH, VECTOR_DB_PATH
+from rag_system.logging_utils import SessionLogging
+from rag_system.json_provider import OrjsonProvider
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Get the path to the static directory
+static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+# Create Flask app
+app = Flask(__name__)
+app.json = OrjsonProvider(app)
+CORS(app)  # Enable CORS for all routes
+
+# Get app config
+app_config = get_app_config()
+
+@dataclass(frozen=True)
+class ChainState:
+    """The active RAG chain together with the session and settings it was built with.
+    
+    Handlers read ``STATE`` once and use only that snapshot; updates build a new
+    instance and rebind ``STATE`` in a single assignment, so readers never see a
+    chain paired with another chain's strategy, template or session.
+    """
+    chain: Any = None
+    session_id: Optional[str] = None
+    log_file: Optional[str] = None
+    strategy: str = "Educational"  # Default to Educational for abortion awareness
+    template: str = "rag_prompt_abortion_awareness"
+
+# Initialize global variables
+STATE = ChainState(
+    template=app_config.get("default_prompt_template", "rag_prompt_abortion_awareness")
+)
+session_logging = None
+response_cache = None
+# Serializes chain rebuilds; readers of STATE never take it
+_state_lock = threading.Lock()
+
+# Get available reasoning strategies
+REASONING_STRATEGIES = app_config.get("reasoning_strategies", {})
+
+# Available prompt templates, loaded on first use
+PROMPT_TEMPLATES = None
+
+def _load_prompt_templates():
+    """Load the available RAG prompt templates once and cache them."""
+    global PROMPT_TEMPLATES
+    if PROMPT_TEMPLATES is not None:
+        return PROMPT_TEMPLATES
+    
+    try:
+        prompt_configs = get_prompt_config("rag_prompt_default")  # Just to load the file
+        templates = {}
+        
+        for key in prompt_configs:
+            if key.startswith("rag_prompt_"):
+                templates[key] = prompt_configs[key].get("description", key)
+    except Exception as e:
+        logger.error(f"Error loading prompt templates: {e}")
+        templates = {"rag_prompt_default": "Default RAG prompt"}
+    
+    PROMPT_TEMPLATES = templates
+    return PROMPT_TEMPLATES
+
+def setup_logging(session_id):
+    """Set up logging for the current session."""
+    log_file = os.path.join(LOG_DIR, f"api_session_{session_id}.log")
+    return SessionLogging(logger, log_file)
+
+def log_interaction(query, response):
+    """Log the interaction to the session's JSONL file for later evaluation."""
+    interaction = {
+        "timestamp": g.request_iso,
+        "duration_ms": (monotonic_ns() - g.request_start_ns) // 1_000_000,
+        "query": query,
+        "response": response
+    }
+    
+    # Written by the session's background listener
+    logger.info("Logged interaction", extra={"interaction": interaction})
+
+def initialize_rag_chain(strategy=None, template=None):
+    """Initialize a new RAG chain and session, and make it the active state.
+    
+    Args:
+        strategy: Reasoning strategy to use (defaults to the current one)
+        template: Prompt template to use (defaults to the current one)
+        
+    Returns:
+        True on success; on failure the previous state stays active
+    """
+    global STATE, session_logging, response_cache
+    
+    with _state_lock:
+        state = STATE
+        strategy = strategy or state.strategy
+        template = template or state.template
+        
+        # Generate a unique session ID
+        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Set up logging, flushing and detaching the previous session's log
+        if session_logging is not None:
+            session_logging.stop()
+        session_logging = setup_logging(session_id)
+        logger.info(f"Starting new API session: {session_id}")
+        
+        # Create the RAG chain
+        try:
+            # Imported lazily: pulls in LangChain, OpenAI and FAISS
+            from rag_system.rag_chain import RAGChain
+            
+            chain = RAGChain(
+                use_reasoning=True,
+                reasoning_strategy=strategy,
+                prompt_template=template
+            )
+            
+            # Cached answers are keyed by template and strategy, so they survive chain resets
+            if response_cache is None:
+                from rag_system.response_cache import ResponseCache
+                response_cache = ResponseCache(chain.embeddings.embed_query, path=RESPONSE_CACHE_PATH)
+                # Answers saved before the last ingest may cite outdated sources
+                response_cache.load(valid_after=os.path.getmtime(os.path.join(VECTOR_DB_PATH, "index.faiss")))
+                atexit.register(response_cache.save)
+        except Exception as e:
+            logger.error(f"Failed to initialize RAG chain: {e}")
+            return False
+        
+        STATE = replace(
+            state,
+            chain=chain,
+            session_id=session_id,
+            log_file=session_logging.log_file,
+            strategy=strategy,
+            template=template
+        )
+        logger.info(f"RAG chain initialized successfully with {strategy} reasoning strategy and {template} prompt template")
+        return True
+
+@app.before_request
+def stamp_request():
+    """Record the request's wall-clock time once and a monotonic start for durations."""
+    g.request_start_ns = monotonic_ns()
+    g.request_iso = datetime.now(timezone.utc).isoformat()
+
+@app.route('/')
+def index():
+    """Serve the index.html file."""
+    return send_from_directory(static_dir, 'index.html')
+
+@app.route('/<path:path>')
+def static_files(path):
+    """Serve static files."""
+    return send_from_directory(static_dir, path)
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    """Health check endpoint."""
+    if STATE.chain is None:
+        return jsonify({"status": "error", "message": "RAG chain not initialized"}), 503
+    return jsonify({"status": "ok", "message": "RAG API is running"}), 200
+
+@app.route('/strategies', methods=['GET'])
+def get_strategies():
+    """Get available reasoning strategies."""
+    return jsonify({
+        "status": "success",
+        "strategies": list(REASONING_STRATEGIES.keys()),
+        "current_strategy": STATE.strategy
+    }), 200
+
+@app.route('/prompt_templates', methods=['GET'])
+def get_prompt_templates():
+    """Get available prompt templates."""
+    return jsonify({
+        "status": "success",
+        "templates": _load_prompt_templates(),
+        "current_template": STATE.template
+    }), 200
+
+@app.route('/strategy', methods=['POST'])
+def set_strategy():
+    """Set the reasoning strategy."""
+    # Get strategy from request
+    data = request.json
+    if not data or 'strategy' not in data:
+        return jsonify({
+            "status": "error",
+            "message": "Missing 'strategy' field in request"
+        }), 400
+    
+    new_strategy = data['strategy']
+    
+    # Check if strategy is valid
+    if new_strategy not in REASONING_STRATEGIES:
+        return jsonify({
+            "status": "error",
+            "message": f"Invalid strategy: {new_strategy}. Available strategies: {list(REASONING_STRATEGIES.keys())}"
+        }), 400
+    
+    # Rebuild the RAG chain with the new strategy
+    success = initialize_rag_chain(strategy=new_strategy)
+    
+    if success:
+        return jsonify({
+            "status": "success",
+            "message": f"Reasoning strategy set to {new_strategy}"
+        }), 200
+    else:
+        return jsonify({
+            "status": "error",
+            "message": "Failed to initialize RAG chain with new strategy"
+        }), 500
+
+@app.route('/prompt_template', methods=['POST'])
+def set_prompt_template():
+    """Set the prompt template."""
+    # Get template from request
+    data = request.json
+    if not data or 'template' not in data:
+        return jsonify({
+            "status": "error",
+            "message": "Missing 'template' field in request"
+        }), 400
+    
+    new_template = data['template']
+    
+    # Check if template is valid
+    templates = _load_prompt_templates()
+    if new_template not in templates:
+        return jsonify({
+            "status": "error",
+            "message": f"Invalid template: {new_template}. Available templates: {list(templates.keys())}"
+        }), 400
+    
+    # Rebuild the RAG chain with the new template
+    success = initialize_rag_chain(template=new_template)
+    
+    if success:
+        return jsonify({
+            "status": "success",
+            "message": f"Prompt template set to {new_template}"
+        }), 200
+    else:
+        return jsonify({
+            "status": "error",
+            "message": "Failed to initialize RAG chain with new prompt template"
+        }), 500
+
+def _sse_event(payload):
+    """Format a payload as a server-sent event."""
+    return f"data: {app.json.dumps(payload)}\n\n"
+
+def _stream_query(state, user_query, cache_namespace, cached_response, query_vector):
+    """Yield the answer to a query as server-sent events.
+    
+    Each text chunk is sent as ``{"token": ...}``; the final event carries the
+    sources and the same metadata as the JSON response of ``/query``.
+    """
+    try:
+        if cached_response is not None:
+            response = cached_response
+            yield _sse_event({"token": response["answer"]})
+        else:
+            sources, tokens = state.chain.stream(user_query)
+            answer_parts = []
+            for token in tokens:
+                answer_parts.append(token)
+                yield _sse_event({"token": token})
+            response = {
+                "query": user_query,
+                "answer": "".join(answer_parts),
+                "sources": sources
+            }
+            response_cache.store(cache_namespace, user_query, response, query_vector)
+        
+        log_interaction(user_query, response)
+        yield _sse_event({
+            "status": "success",
+            "done": True,
+            "sources": response["sources"],
+            "reasoning_strategy": state.strategy,
+            "prompt_template": state.template
+        })
+    except Exception as e:
+        logger.error(f"Error streaming query: {e}")
+        yield _sse_event({
+            "status": "error",
+            "done": True,
+            "message": f"Error processing query: {str(e)}"
+        })
+
+@app.route('/query', methods=['POST'])
+def query():
+    """Query endpoint to ask questions to the RAG system."""
+    # Check if RAG chain is initialized
+    if STATE.chain is None:
+        success = initialize_rag_chain()
+        if not success:
+            return jsonify({
+                "status": "error",
+                "message": "Failed to initialize RAG chain. Check logs for details."
+            }), 500
+    
+    # Get query from request
+    data = request.json
+    if not data or 'query' not in data:
+        return jsonify({
+            "status": "error",
+            "message": "Missing 'query' field in request"
+        }), 400
+    
+    user_query = data['query']
+    
+    # Use one consistent snapshot for the whole request
+    state = STATE
+    
+    try:
+        # Serve repeated or near-identical questions from the cache
+        cache_namespace = f"{state.template}|{state.strategy}"
+        response, query_vector = response_cache.lookup(cache_namespace, user_query)
+        
+        # Stream tokens as server-sent events when the client asks for it
+        if data.get("stream") is True or request.accept_mimetypes.best == "text/event-stream":
+            return Response(
+                stream_with_context(_stream_query(state, user_query, cache_namespace, response, query_vector)),
+                mimetype="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+        
+        # Process the query
+        if response is None:
+            response = state.chain.query(user_query)
+            response_cache.store(cache_namespace, user_query, response, query_vector)
+        
+        # Log the interaction
+        log_interaction(user_query, response)
+        
+        # Return the response
+        return jsonify({
+            "status": "success",
+            "answer": response["answer"],
+            "sources": response["sources"],
+            "reasoning_strategy": state.strategy,
+            "prompt_template": state.template
+        }), 200
+    except Exception as e:
+        logger.error(f"Error processing query: {e}")
+        return jsonify({
+            "status": "error",
+            "message": f"Error processing query: {str(e)}"
+        }), 500
+
+@app.route('/reset', methods=['POST'])
+def reset():
+    """Reset the RAG chain to start a new session."""
+    # Initialize a new RAG chain (and session) with the current settings
+    success = initialize_rag_chain()
+    
+    if success:
+        return jsonify({
+            "status": "success",
+            "message": f"RAG chain reset successfully. New session ID: {STATE.session_id}"
+        }), 200
+    else:
+        return jsonify({
+            "status": "error",
+            "message": "Failed to reset RAG chain. Check logs for details."
+        }), 500
+
+def main():
+    """Main function to serve the Flask app with gunicorn."""
+    # Create static directory if it doesn't exist
+    os.makedirs(static_dir, exist_ok=True)
+    
+    # Hand the process over to gunicorn; the RAG chain is initialized in each worker
+    config_path = os.path.join(BASE_DIR, "gunicorn.conf.py")
+    os.execvp("gunicorn", ["gunicorn", "-c", config_path, "rag_system.api:app"])
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Process-wide API clients shared across RAG chain instances.
+"""
+
+import functools
+
+from rag_system.config import EMBEDDING_DIMENSIONS, EMBEDDING_MODEL, LLM_MODEL
+
+
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+
+def _with_query_cache(embeddings):
+    """Wrap an embeddings client so repeated query strings are embedded only once."""
+    from langchain_core.embeddings import Embeddings
+
+    class QueryCachedEmbeddings(Embeddings):
+        def __init__(self, inner):
+            self.inner = inner
+            self._embed_query = functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(
+                lambda text: tuple(inner.embed_query(text))
+            )
+
+        def embed_documents(self, texts):
+            return self.inner.embed_documents(texts)
+
+        def embed_query(self, text):
+            return list(self._embed_query(text))
+
+    return QueryCachedEmbeddings(embeddings)
+
+
+@functools.lru_cache(maxsize=None)
+def get_http_client():
+    """Return the pooled HTTP/2 client shared by every OpenAI client in the process.
+
+    Re-creating the RAG chain (strategy/template changes, resets) reuses its open
+    connections instead of repeating the TCP and TLS handshakes, and concurrent
+    embedding and chat requests are multiplexed over the same connections.
+    """
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        timeout=60,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_embeddings():
+    """Return the shared OpenAI embeddings client.
+
+    Query embeddings are memoized, so the response cache lookup and the retriever
+    share one API call per question.
+    """
+    from langchain_openai import OpenAIEmbeddings
+
+    return _with_query_cache(OpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        dimensions=EMBEDDING_DIMENSIONS,
+        http_client=get_http_client(),
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def get_chat_model():
+    """Return the shared chat model client."""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model_name=LLM_MODEL, temperature=0.2, http_client=get_http_client())
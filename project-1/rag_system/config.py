@@ -1,7 +1,8 @@
 import os
-import yaml
 from dotenv import load_dotenv
 
+from rag_system import config_loader
+
 # Load environment variables
 load_dotenv()
 
@@ -14,6 +15,8 @@ if not OPENAI_API_KEY:
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 CONFIG_DIR = os.path.join(BASE_DIR, "config")
 VECTOR_DB_PATH = os.path.join(BASE_DIR, "vector_db")
+EMBEDDING_CACHE_DIR = os.path.join(VECTOR_DB_PATH, "emb_cache")
+RESPONSE_CACHE_PATH = os.path.join(VECTOR_DB_PATH, "response_cache.pkl")
 DATA_DIR = os.path.join(BASE_DIR, "data")
 LOG_DIR = os.path.join(BASE_DIR, "logs")
 
@@ -25,8 +28,7 @@ os.makedirs(CONFIG_DIR, exist_ok=True)
 def load_yaml_config(filename):
     config_path = os.path.join(CONFIG_DIR, filename)
     if os.path.exists(config_path):
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return config_loader.load_yaml_config(config_path)
     return {}
 
 # Load configurations
@@ -35,8 +37,24 @@ prompt_config = load_yaml_config("prompt_config.yaml")
 
 # Model settings
 EMBEDDING_MODEL = "text-embedding-3-small"
+# text-embedding-3 vectors can be shortened by the API with little loss in quality
+EMBEDDING_DIMENSIONS = system_config.get("embedding_dimensions", 1024)
 LLM_MODEL = system_config.get("llm", "gpt-4o-mini")
 
+# Ingestion embedding requests
+EMBEDDING_BATCH_SIZE = 512
+EMBEDDING_MAX_WORKERS = 8
+
+# Vector index settings (HNSW graph for approximate nearest-neighbour search)
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+
+# Retrieval settings, tunable from the "retrieval" section of config.yaml
+RETRIEVAL_CONFIG = system_config.get("retrieval", {})
+RETRIEVAL_K = RETRIEVAL_CONFIG.get("k", 4)
+HNSW_EF_SEARCH = RETRIEVAL_CONFIG.get("ef_search", 64)
+IVF_NPROBE = RETRIEVAL_CONFIG.get("nprobe", 16)
+
 # Reasoning strategies
 REASONING_STRATEGIES = system_config.get("reasoning_strategies", {})
 
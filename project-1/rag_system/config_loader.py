@@ -3,13 +3,33 @@ Utility functions for loading and managing configuration files.
 """
 
 import os
+import functools
 import yaml
 from typing import Dict, Any, Optional
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml_cached(abs_path: str, mtime: float) -> Dict[str, Any]:
+    """Parses a YAML file; cached per (path, mtime) so edits are picked up."""
+    with open(abs_path, 'r') as file:
+        try:
+            return yaml.load(file, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"Error parsing YAML file {abs_path}: {e}")
+
 
 def load_yaml_config(config_path: str) -> Dict[str, Any]:
     """Loads a YAML configuration file.
     
+    Parsed files are cached in-process until their modification time changes,
+    so the returned dictionary is shared and must be treated as read-only.
+    
     Args:
         config_path: Path to the YAML configuration file
         
@@ -23,11 +43,8 @@ def load_yaml_config(config_path: str) -> Dict[str, Any]:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_path, 'r') as file:
-        try:
-            return yaml.safe_load(file)
-        except yaml.YAMLError as e:
-            raise yaml.YAMLError(f"Error parsing YAML file {config_path}: {e}")
+    abs_path = os.path.abspath(config_path)
+    return _load_yaml_cached(abs_path, os.path.getmtime(abs_path))
 
 
 def get_prompt_config(config_name: str, config_path: str = "config/prompt_config.yaml") -> Dict[str, Any]:
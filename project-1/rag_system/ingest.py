@@ -0,0 +1,184 @@
+import glob
+import os
+import logging
+from datetime import datetime
+from typing import List
+import pickle
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from rag_system.config import (
+    DATA_DIR,
+    VECTOR_DB_PATH,
+    EMBEDDING_MODEL,
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_WORKERS,
+    EMBEDDING_CACHE_DIR,
+    HNSW_M,
+    HNSW_EF_CONSTRUCTION,
+)
+from rag_system.clients import get_embeddings
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Configure pickle to use a safer protocol
+pickle.HIGHEST_PROTOCOL = 4
+
+DOCUMENT_EXTENSIONS = (".txt", ".pdf", ".csv")
+
+def _load_one(path: str, ext: str):
+    """Load a single file with the loader for its extension (runs in a worker process)."""
+    from langchain_community.document_loaders import (
+        TextLoader,
+        PyPDFLoader,
+        CSVLoader,
+    )
+    
+    loader_cls = {".txt": TextLoader, ".pdf": PyPDFLoader, ".csv": CSVLoader}[ext]
+    return loader_cls(path).load()
+
+def load_documents():
+    """Load documents from the data directory."""
+    logger.info(f"Loading documents from {DATA_DIR}")
+    
+    files = [
+        (path, ext)
+        for ext in DOCUMENT_EXTENSIONS
+        for path in glob.glob(os.path.join(DATA_DIR, f"**/*{ext}"), recursive=True)
+    ]
+    if not files:
+        return []
+    
+    documents = []
+    counts = {ext: 0 for ext in DOCUMENT_EXTENSIONS}
+    # Parsing (PDFs especially) is CPU-bound, so spread files across processes
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(files))) as executor:
+        futures = {executor.submit(_load_one, path, ext): (path, ext) for path, ext in files}
+        for future in as_completed(futures):
+            path, ext = futures[future]
+            try:
+                file_documents = future.result()
+            except Exception as e:
+                logger.warning(f"Error loading {path}: {e}")
+                continue
+            counts[ext] += len(file_documents)
+            documents.extend(file_documents)
+    
+    for ext, count in counts.items():
+        logger.info(f"Loaded {count} documents with extension {ext}")
+    
+    return documents
+
+def split_documents(documents):
+    """Split documents into chunks."""
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    
+    logger.info("Splitting documents into chunks")
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=1000,
+        chunk_overlap=200
+    )
+    return text_splitter.split_documents(documents)
+
+def embed_texts(embeddings, texts: List[str]) -> List[List[float]]:
+    """Embed texts in fixed-size batches, issuing the batch requests concurrently."""
+    batches = [
+        texts[i:i + EMBEDDING_BATCH_SIZE]
+        for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ]
+    logger.info(f"Embedding {len(texts)} chunks in {len(batches)} batches")
+    
+    with ThreadPoolExecutor(max_workers=EMBEDDING_MAX_WORKERS) as executor:
+        # map preserves batch order, so vectors stay aligned with texts
+        results = executor.map(embeddings.embed_documents, batches)
+        return [vector for batch in results for vector in batch]
+
+def build_hnsw_index(vectors: List[List[float]]):
+    """Build an HNSW index (L2 metric) over the given vectors, stored as 8-bit codes."""
+    import faiss
+    import numpy as np
+    
+    matrix = np.asarray(vectors, dtype="float32")
+    index = faiss.IndexHNSWSQ(matrix.shape[1], faiss.ScalarQuantizer.QT_8bit, HNSW_M)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    # The scalar quantizer learns per-dimension ranges before vectors can be encoded
+    index.train(matrix)
+    index.add(matrix)
+    return index
+
+def create_vector_store(documents):
+    """Create a FAISS vector store from the documents."""
+    from langchain.embeddings import CacheBackedEmbeddings
+    from langchain.storage import LocalFileStore
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+    
+    logger.info("Creating vector store")
+    embeddings = get_embeddings()
+    
+    # Reuse vectors of unchanged chunks across runs (keyed by a hash of the chunk text)
+    cached_embeddings = CacheBackedEmbeddings.from_bytes_store(
+        embeddings,
+        LocalFileStore(EMBEDDING_CACHE_DIR),
+        namespace=f"{EMBEDDING_MODEL}-{EMBEDDING_DIMENSIONS}",
+    )
+    
+    # Create vector store directory if it doesn't exist
+    os.makedirs(os.path.dirname(VECTOR_DB_PATH), exist_ok=True)
+    
+    # Create and save the vector store
+    texts = [doc.page_content for doc in documents]
+    metadatas = [doc.metadata for doc in documents]
+    vectors = embed_texts(cached_embeddings, texts)
+    ids = [str(uuid.uuid4()) for _ in documents]
+    vector_store = FAISS(
+        embedding_function=embeddings,
+        index=build_hnsw_index(vectors),
+        docstore=InMemoryDocstore({
+            doc_id: Document(page_content=text, metadata=metadata)
+            for doc_id, text, metadata in zip(ids, texts, metadatas)
+        }),
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
+    vector_store.save_local(VECTOR_DB_PATH)
+    logger.info(f"Vector store saved to {VECTOR_DB_PATH}")
+    
+    return vector_store
+
+def main():
+    """Main function to ingest documents and create vector store."""
+    try:
+        start_time = datetime.now()
+        logger.info("Starting document ingestion")
+        
+        # Load documents
+        documents = load_documents()
+        if not documents:
+            logger.warning(f"No documents found in {DATA_DIR}. Please add some documents first.")
+            return
+        
+        logger.info(f"Loaded {len(documents)} documents in total")
+        
+        # Split documents
+        splits = split_documents(documents)
+        logger.info(f"Split into {len(splits)} chunks")
+        
+        # Create vector store
+        create_vector_store(splits)
+        
+        end_time = datetime.now()
+        logger.info(f"Ingestion completed in {end_time - start_time}")
+        
+    except Exception as e:
+        logger.error(f"Error during document ingestion: {e}")
+        raise
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Flask JSON provider backed by orjson.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import JSONProvider
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Serializes ``jsonify`` responses with orjson instead of the stdlib ``json`` module."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=str, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        # orjson already produces bytes; skip the str round-trip of the base class
+        return self._app.response_class(
+            orjson.dumps(obj, default=str, option=ORJSON_OPTIONS),
+            mimetype="application/json",
+        )
@@ -0,0 +1,84 @@
+"""
+Session logging helpers that keep log file writes off the request path.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+import orjson
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonlHandler(logging.Handler):
+    """Appends the ``interaction`` attached to a log record as a single JSON line.
+
+    Records without an ``interaction`` attribute (passed via ``extra``) are ignored,
+    so the handler can share a queue with the plain-text session log.
+    """
+
+    def __init__(self, path: str, buffering: int = 8192):
+        super().__init__()
+        self.path = path
+        self._fh = open(path, 'ab', buffering=buffering)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        interaction = getattr(record, "interaction", None)
+        if interaction is None:
+            return
+        try:
+            self._fh.write(orjson.dumps(interaction, default=str, option=orjson.OPT_APPEND_NEWLINE))
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._fh.closed:
+                self._fh.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            if not self._fh.closed:
+                self._fh.close()
+        super().close()
+
+
+class SessionLogging:
+    """Routes a logger's records for one session through a background listener.
+
+    The logger only gets a ``QueueHandler``; the ``FileHandler`` for the text log and
+    the ``JsonlHandler`` for the interaction log run on the listener's thread.
+    """
+
+    def __init__(self, logger: logging.Logger, log_file: str):
+        self.logger = logger
+        self.log_file = log_file
+        self.json_log_file = log_file.replace(".log", ".jsonl")
+
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self._handlers = (file_handler, JsonlHandler(self.json_log_file))
+
+        log_queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._listener: Optional[logging.handlers.QueueListener] = logging.handlers.QueueListener(
+            log_queue, *self._handlers
+        )
+
+        self.logger.addHandler(self._queue_handler)
+        self._listener.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Drain pending records, close the log files and detach from the logger."""
+        if self._listener is None:
+            return
+        self.logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        self._listener = None
+        for handler in self._handlers:
+            handler.close()
+        atexit.unregister(self.stop)
@@ -1,14 +1,11 @@
 import os
-import sys
 import logging
-import json
 from datetime import datetime
 import argparse
 
-# Import project modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from src.rag_chain import RAGChain
-from src.config import LOG_DIR
+from rag_system.rag_chain import RAGChain
+from rag_system.config import LOG_DIR
+from rag_system.logging_utils import SessionLogging
 
 # Configure logging
 logging.basicConfig(
@@ -20,48 +17,22 @@ logger = logging.getLogger(__name__)
 def setup_logging(session_id):
     """Set up logging for the current session."""
     log_file = os.path.join(LOG_DIR, f"session_{session_id}.log")
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    logger.addHandler(file_handler)
-    return log_file
+    return SessionLogging(logger, log_file)
 
-def log_interaction(log_file, query, response):
-    """Log the interaction to a JSON file for later evaluation."""
+def log_interaction(query, response):
+    """Log the interaction to the session's JSONL file for later evaluation."""
     interaction = {
         "timestamp": datetime.now().isoformat(),
         "query": query,
         "response": response
     }
     
-    # Convert to JSON-serializable format
-    if "source_documents" in interaction["response"]:
-        interaction["response"]["source_documents"] = [
-            {"content": doc["content"], "source": doc["source"]}
-            for doc in interaction["response"]["source_documents"]
-        ]
-    
-    # Create JSON log file if it doesn't exist
-    json_log_file = log_file.replace(".log", ".json")
-    
-    # Append to the JSON log file
-    try:
-        if os.path.exists(json_log_file):
-            with open(json_log_file, 'r') as f:
-                interactions = json.load(f)
-        else:
-            interactions = []
-        
-        interactions.append(interaction)
-        
-        with open(json_log_file, 'w') as f:
-            json.dump(interactions, f, indent=2)
-    except Exception as e:
-        logger.error(f"Error logging interaction: {e}")
+    # Written by the session's background listener
+    logger.info("Logged interaction", extra={"interaction": interaction})
 
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="RAG System CLI")
-    parser.add_argument("--no-memory", action="store_true", help="Disable conversation memory")
     parser.add_argument("--no-reasoning", action="store_true", help="Disable intermediate reasoning steps")
     return parser.parse_args()
 
@@ -74,13 +45,13 @@ def main():
     session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Set up logging
-    log_file = setup_logging(session_id)
+    session_logging = setup_logging(session_id)
+    log_file = session_logging.log_file
     logger.info(f"Starting new session: {session_id}")
     
     # Create the RAG chain
     try:
         rag_chain = RAGChain(
-            use_memory=not args.no_memory,
             use_reasoning=not args.no_reasoning
         )
         logger.info("RAG chain initialized successfully")
@@ -124,13 +95,13 @@ def main():
             print("\nAnswer:", response["answer"])
             
             # Print sources
-            if response.get("source_documents"):
+            if response["sources"]:
                 print("\nSources:")
-                for i, doc in enumerate(response["source_documents"]):
+                for i, doc in enumerate(response["sources"]):
                     print(f"  {i+1}. {doc.get('source', 'Unknown source')}")
             
             # Log the interaction
-            log_interaction(log_file, query, response)
+            log_interaction(query, response)
             
         except KeyboardInterrupt:
             print("\nSession terminated by user.")
@@ -140,6 +111,7 @@ def main():
             print(f"Error: {e}")
     
     logger.info(f"Session {session_id} ended")
+    session_logging.stop()
     print(f"\nSession logs saved to {log_file}")
 
 if __name__ == "__main__":
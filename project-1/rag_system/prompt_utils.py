@@ -2,7 +2,7 @@
 Prompt template construction functions for building modular prompts.
 """
 
-from typing import Union, List, Optional, Dict, Any
+from typing import Union, List, Optional, Dict, Any, Callable
 
 
 def lowercase_first_char(text: str) -> str:
@@ -95,6 +95,14 @@ def build_prompt_from_config(
     if goal := config.get("goal"):
         prompt_parts.append(f"Your goal is to achieve the following outcome:\n{goal}")
 
+    # Everything above is invariant per configuration; keep the per-call input last
+    # so providers can reuse the cached prompt prefix across requests.
+    reasoning_strategy = config.get("reasoning_strategy")
+    if reasoning_strategy and reasoning_strategy != "None" and app_config:
+        strategies = app_config.get("reasoning_strategies", {})
+        if strategy_text := strategies.get(reasoning_strategy):
+            prompt_parts.append(strategy_text.strip())
+
     if input_data:
         prompt_parts.append(
             "Here is the content you need to work with:\n"
@@ -102,12 +110,6 @@ def build_prompt_from_config(
             "```\n" + input_data.strip() + "\n```\n<<<END CONTENT>>>"
         )
 
-    reasoning_strategy = config.get("reasoning_strategy")
-    if reasoning_strategy and reasoning_strategy != "None" and app_config:
-        strategies = app_config.get("reasoning_strategies", {})
-        if strategy_text := strategies.get(reasoning_strategy):
-            prompt_parts.append(strategy_text.strip())
-
     prompt_parts.append("Now perform the task as instructed above.")
     return "\n\n".join(prompt_parts)
 
@@ -160,4 +162,39 @@ def create_rag_prompt(
         config["reasoning_strategy"] = reasoning_strategy
     
     # Build the prompt
-    return build_prompt_from_config(config, input_data, app_config) 
\ No newline at end of file
+    return build_prompt_from_config(config, input_data, app_config) 
+
+_CONTEXT_SLOT = "\x00CONTEXT\x00"
+_QUESTION_SLOT = "\x00QUESTION\x00"
+
+
+def compile_rag_prompt(
+    prompt_config: Dict[str, Any],
+    app_config: Optional[Dict[str, Any]] = None,
+    reasoning_strategy: str = None,
+) -> Callable[[str, str], str]:
+    """Builds the RAG prompt once and returns a fast renderer for it.
+
+    Only the context and question vary between queries, so the prompt is built with
+    placeholder slots and split around them; rendering is then plain concatenation.
+    The output matches ``create_rag_prompt`` for the same arguments.
+
+    Args:
+        prompt_config: Dictionary with prompt configuration
+        app_config: Optional app-wide configuration
+        reasoning_strategy: Optional reasoning strategy to use
+
+    Returns:
+        A function taking ``(context, question)`` and returning the full prompt
+    """
+    template = create_rag_prompt(
+        prompt_config, _CONTEXT_SLOT, _QUESTION_SLOT, app_config, reasoning_strategy
+    )
+    prefix, rest = template.split(_CONTEXT_SLOT, 1)
+    mid, suffix = rest.split(_QUESTION_SLOT, 1)
+
+    def render(context: str, question: str) -> str:
+        # The question ends the content block, which build_prompt_from_config strips
+        return f"{prefix}{context}{mid}{question.rstrip()}{suffix}"
+
+    return render
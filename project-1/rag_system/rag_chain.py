@@ -0,0 +1,221 @@
+import logging
+import re
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+from langchain_community.vectorstores import FAISS
+
+from rag_system.config import RETRIEVAL_K
+from rag_system.clients import get_chat_model, get_embeddings
+from rag_system.config_loader import get_app_config, get_prompt_config
+from rag_system.prompt_utils import compile_rag_prompt
+from rag_system.store import load_vector_store
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+REFUSAL_MESSAGE = (
+    "I'm a specialized educational assistant focused only on abortion awareness and reproductive health. "
+    "I'm not able to answer questions outside of this specific focus area. "
+    "Please feel free to ask me about abortion procedures, reproductive health information, "
+    "or related women's health topics, and I'll be happy to provide factual, educational information."
+)
+
+# Abortion-related keywords for filtering
+ABORTION_KEYWORDS = (
+    'abortion', 'reproductive', 'pregnancy', 'termination', 'pro-choice', 
+    'pro-life', 'unborn', 'fetus', 'womb', 'trimester', 'contraception', 
+    'planned parenthood', 'women\'s health', 'reproductive rights',
+    'medical procedure', 'healthcare access', 'roe v wade'
+)
+# One case-insensitive pass over the query instead of a scan per keyword, compiled once
+# per process rather than per chain. No word boundaries: keywords match as substrings
+# (e.g. "abortions").
+_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in ABORTION_KEYWORDS),
+    re.IGNORECASE
+)
+
+class RAGChain:
+    def __init__(self, 
+                 use_reasoning: bool = True, 
+                 reasoning_strategy: str = "CoT",
+                 prompt_template: str = None,
+                 embeddings=None,
+                 vector_store: FAISS = None):
+        """Initialize the RAG chain.
+        
+        Args:
+            use_reasoning: Whether to use intermediate reasoning steps
+            reasoning_strategy: The reasoning strategy to use ('CoT', 'ReAct', or 'Self-Ask')
+            prompt_template: The prompt template configuration to use
+            embeddings: Embeddings client to use (defaults to the shared client)
+            vector_store: Vector store to search (defaults to the shared, memory-mapped store)
+        """
+        self.use_reasoning = use_reasoning
+        self.reasoning_strategy = reasoning_strategy if use_reasoning else None
+        
+        # Load app configuration
+        self.app_config = get_app_config()
+        
+        # Get default prompt template if not specified
+        if prompt_template is None:
+            prompt_template = self.app_config.get("default_prompt_template", "rag_prompt_default")
+        
+        self.prompt_template = prompt_template
+        
+        # Check if we should only answer abortion-related questions
+        self.only_answer_abortion_topics = self.app_config.get("only_answer_abortion_topics", False)
+        
+        # Load prompt configuration
+        try:
+            self.prompt_config = get_prompt_config(prompt_template)
+            logger.info(f"Using prompt template: {prompt_template}")
+        except KeyError:
+            logger.warning(f"Prompt template '{prompt_template}' not found. Using default.")
+            self.prompt_config = get_prompt_config("rag_prompt_default")
+        
+        # The prompt only varies by context and question from here on, so build it once
+        self.render_prompt = compile_rag_prompt(
+            self.prompt_config,
+            self.app_config,
+            self.reasoning_strategy if self.use_reasoning else None
+        )
+        
+        # Load vector store
+        self.embeddings = embeddings or get_embeddings()
+        self.vector_store = vector_store if vector_store is not None else load_vector_store()
+        self._init_retriever()
+        
+        # Initialize LLM
+        self.llm = get_chat_model()
+    
+    def _is_abortion_related(self, query: str, docs: List[Any]) -> bool:
+        """Check if a query is related to abortion awareness.
+        
+        Args:
+            query: The query to check
+            docs: Documents already retrieved for the query
+            
+        Returns:
+            True if the query is related to abortion awareness, False otherwise
+        """
+        # Check for keyword matches
+        if _KEYWORD_RE.search(query):
+            return True
+        
+        # If we don't find any keywords, check what the retriever found
+        if docs:
+            # If we have relevant documents, the query is likely abortion-related
+            return True
+        
+        return False
+    
+    def _init_retriever(self):
+        """Create the retriever over the loaded vector store."""
+        self.retriever = self.vector_store.as_retriever(
+            search_type="similarity",
+            search_kwargs={"k": RETRIEVAL_K}
+        )
+    
+    def _retrieve(self, question: str) -> Optional[List[Any]]:
+        """Retrieve documents for a question.
+        
+        Args:
+            question: The question to ask
+            
+        Returns:
+            Retrieved documents with duplicate texts removed, or None if the question is out
+            of scope and should be refused
+        """
+        # One retrieval serves both the topic check and the answer context
+        docs = self.retriever.get_relevant_documents(question)
+        
+        # Check if we should only answer abortion-related questions
+        if self.only_answer_abortion_topics and not self._is_abortion_related(question, docs):
+            logger.info(f"Refusing to answer non-abortion-related query: {question}")
+            return None
+        
+        return self._deduplicate(docs)
+    
+    @staticmethod
+    def _deduplicate(docs: List[Any]) -> List[Any]:
+        """Drop documents whose text repeats an earlier one, keeping retrieval order."""
+        seen = set()
+        unique = []
+        for doc in docs:
+            if doc.page_content not in seen:
+                seen.add(doc.page_content)
+                unique.append(doc)
+        return unique
+    
+    def _build_prompt(self, question: str, docs: List[Any]) -> str:
+        """Construct the prompt from the precompiled template."""
+        context = "\n\n".join([doc.page_content for doc in docs])
+        return self.render_prompt(context, question)
+    
+    @staticmethod
+    def _format_sources(docs: List[Any]) -> List[Dict[str, str]]:
+        return [
+            {"content": doc.page_content, "source": doc.metadata.get("source", "unknown")}
+            for doc in docs
+        ]
+    
+    def query(self, question: str) -> Dict[str, Any]:
+        """Query the RAG chain with a question.
+        
+        Args:
+            question: The question to ask
+            
+        Returns:
+            Dict containing the answer and its sources as ``{"content", "source"}`` dicts
+        """
+        logger.info(f"Query: {question}")
+        
+        docs = self._retrieve(question)
+        if docs is None:
+            # Return a polite refusal for non-abortion-related questions
+            return {
+                "query": question,
+                "answer": REFUSAL_MESSAGE,
+                "sources": []
+            }
+        
+        # Execute the LLM with the constructed prompt
+        result = self.llm.invoke(self._build_prompt(question, docs))
+        
+        # Format the response
+        response = {
+            "query": question,
+            "answer": result.content,
+            "sources": self._format_sources(docs)
+        }
+        
+        logger.info(f"Answer: {response['answer']}")
+        return response
+    
+    def stream(self, question: str) -> Tuple[List[Dict[str, str]], Iterator[str]]:
+        """Query the RAG chain, streaming the answer as it is generated.
+        
+        Retrieval runs before this returns; the LLM call only starts when the token
+        iterator is consumed.
+        
+        Args:
+            question: The question to ask
+            
+        Returns:
+            Tuple of (source documents, iterator over answer text chunks)
+        """
+        logger.info(f"Query (streaming): {question}")
+        
+        docs = self._retrieve(question)
+        if docs is None:
+            return [], iter([REFUSAL_MESSAGE])
+        
+        prompt_str = self._build_prompt(question, docs)
+        return self._format_sources(docs), self._stream_answer(prompt_str)
+    
+    def _stream_answer(self, prompt_str: str) -> Iterator[str]:
+        """Yield the answer's text chunks as the LLM produces them."""
+        for chunk in self.llm.stream(prompt_str):
+            if chunk.content:
+                yield chunk.content
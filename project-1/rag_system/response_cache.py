@@ -0,0 +1,223 @@
+"""
+Two-tier cache for RAG responses.
+
+Exact repeats are served from an LRU keyed on the normalized query; paraphrases are
+served by a cosine-similarity lookup over the embeddings of previously answered queries.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Caches RAG responses by exact query and by semantic similarity.
+
+    Entries are grouped by a namespace (e.g. prompt template and reasoning strategy)
+    so answers produced under one configuration are never served under another.
+    """
+
+    def __init__(self,
+                 embed_query: Callable[[str], List[float]],
+                 max_size: int = 512,
+                 similarity_threshold: float = 0.97,
+                 path: Optional[str] = None,
+                 save_every: int = 16):
+        """Initialize the cache.
+
+        Args:
+            embed_query: Function returning the embedding vector for a query
+            max_size: Maximum number of cached responses per tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            path: File the cache is persisted to, so answers survive restarts
+            save_every: Number of new responses after which the cache is saved to ``path``
+        """
+        self.embed_query = embed_query
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self.path = path
+        self.save_every = save_every
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        # Snapshots are numbered so a slow write never replaces a newer file
+        self._save_lock = threading.Lock()
+        self._snapshots = 0
+        self._written = 0
+        self._exact: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # namespace -> (index over normalized query vectors, responses in index order)
+        self._semantic: Dict[str, Tuple[faiss.Index, List[Dict[str, Any]], List[np.ndarray]]] = {}
+
+    @staticmethod
+    def _key(namespace: str, query: str) -> str:
+        return hashlib.sha256(f"{namespace}|{query.strip().lower()}".encode()).hexdigest()
+
+    def _embed(self, query: str) -> Optional[np.ndarray]:
+        try:
+            vector = np.asarray(self.embed_query(query), dtype="float32").reshape(1, -1)
+        except Exception as e:
+            logger.warning(f"Could not embed query for semantic cache: {e}")
+            return None
+        faiss.normalize_L2(vector)
+        return vector
+
+    def lookup(self, namespace: str, query: str) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """Look up a cached response.
+
+        Args:
+            namespace: Cache namespace for the current chain configuration
+            query: The user's query
+
+        Returns:
+            Tuple of (cached response or None, query embedding to pass to ``store``)
+        """
+        key = self._key(namespace, query)
+        with self._lock:
+            if key in self._exact:
+                self._exact.move_to_end(key)
+                logger.info("Response cache hit (exact)")
+                return self._exact[key], None
+
+        vector = self._embed(query)
+        if vector is None:
+            return None, None
+
+        with self._lock:
+            entry = self._semantic.get(namespace)
+            if entry is not None and entry[0].ntotal:
+                index, responses, _ = entry
+                scores, ids = index.search(vector, 1)
+                if scores[0][0] >= self.similarity_threshold:
+                    logger.info(f"Response cache hit (semantic, score={scores[0][0]:.3f})")
+                    return responses[ids[0][0]], vector
+        return None, vector
+
+    def store(self, namespace: str, query: str, response: Dict[str, Any],
+              vector: Optional[np.ndarray] = None) -> None:
+        """Store a response in both cache tiers.
+
+        Args:
+            namespace: Cache namespace for the current chain configuration
+            query: The user's query
+            response: The RAG response to cache
+            vector: Query embedding returned by ``lookup``, if any
+        """
+        key = self._key(namespace, query)
+        snapshot = None
+        with self._lock:
+            self._exact[key] = response
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_size:
+                self._exact.popitem(last=False)
+
+            if vector is not None:
+                self._store_vector(namespace, response, vector)
+
+            self._unsaved += 1
+            if self.path and self._unsaved >= self.save_every:
+                snapshot = self._snapshot_locked()
+        # Written outside the lock, so lookups do not wait on the disk
+        if snapshot is not None:
+            self._write(*snapshot)
+
+    def _store_vector(self, namespace: str, response: Dict[str, Any], vector: np.ndarray) -> None:
+        entry = self._semantic.get(namespace)
+        if entry is None:
+            entry = (faiss.IndexFlatIP(vector.shape[1]), [], [])
+            self._semantic[namespace] = entry
+        index, responses, vectors = entry
+        responses.append(response)
+        vectors.append(vector)
+        if len(responses) > self.max_size:
+            # Drop the oldest entries and rebuild the (small) flat index
+            del responses[:-self.max_size]
+            del vectors[:-self.max_size]
+            index.reset()
+            index.add(np.vstack(vectors))
+        else:
+            index.add(vector)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+
+    def save(self) -> None:
+        """Write the cache to ``path``, if one is set."""
+        if not self.path:
+            return
+        with self._lock:
+            snapshot = self._snapshot_locked()
+        self._write(*snapshot)
+
+    def _snapshot_locked(self) -> Tuple[int, Dict[str, Any]]:
+        """Copy the cache contents for ``_write``; the caller holds ``_lock``."""
+        self._unsaved = 0
+        self._snapshots += 1
+        data = {
+            "exact": list(self._exact.items()),
+            "semantic": {
+                namespace: (np.vstack(vectors), list(responses))
+                for namespace, (_, responses, vectors) in self._semantic.items()
+                if vectors
+            },
+        }
+        return self._snapshots, data
+
+    def _write(self, snapshot_id: int, data: Dict[str, Any]) -> None:
+        with self._save_lock:
+            if snapshot_id <= self._written:
+                return
+            # Write a temporary file and rename it, so readers never see a partial cache
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.path)
+                self._written = snapshot_id
+            except OSError as e:
+                logger.warning(f"Could not save response cache to {self.path}: {e}")
+
+    def load(self, valid_after: float = 0.0) -> bool:
+        """Replace the cache contents with those saved at ``path``.
+
+        Args:
+            valid_after: Ignore a saved cache last written before this timestamp
+                (e.g. the vector store's modification time)
+
+        Returns:
+            True if a saved cache was loaded
+        """
+        if not self.path or not os.path.exists(self.path):
+            return False
+        if os.path.getmtime(self.path) < valid_after:
+            logger.info("Saved response cache predates the vector store; ignoring it")
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load response cache from {self.path}: {e}")
+            return False
+
+        semantic = {}
+        for namespace, (matrix, responses) in data["semantic"].items():
+            index = faiss.IndexFlatIP(matrix.shape[1])
+            index.add(matrix)
+            semantic[namespace] = (index, list(responses), [row.reshape(1, -1) for row in matrix])
+        with self._lock:
+            self._exact = OrderedDict(data["exact"])
+            self._semantic = semantic
+            self._unsaved = 0
+        logger.info(f"Loaded {len(self._exact)} cached responses from {self.path}")
+        return True
@@ -0,0 +1,72 @@
+"""
+Process-wide vector store, loaded once and shared by every RAG chain instance.
+"""
+
+import functools
+import logging
+import os
+import pickle
+
+from rag_system.clients import get_embeddings
+from rag_system.config import VECTOR_DB_PATH, EMBEDDING_DIMENSIONS, HNSW_EF_SEARCH, IVF_NPROBE
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def load_index():
+    """Load the FAISS index and docstore written by ``ingest.py``.
+
+    The index's vector codes are memory-mapped read-only (``IO_FLAG_MMAP_IFC``), so
+    they stay in the page cache instead of being copied into the process heap; only
+    the HNSW graph is read into memory. The result is cached; re-creating the RAG
+    chain never reloads the index or the docstore pickle.
+    """
+    import faiss
+
+    if not os.path.exists(VECTOR_DB_PATH):
+        raise ValueError(f"Vector store not found at {VECTOR_DB_PATH}. Run ingest.py first.")
+
+    logger.info(f"Loading vector store from {VECTOR_DB_PATH}")
+    index = faiss.read_index(
+        os.path.join(VECTOR_DB_PATH, "index.faiss"),
+        # IO_FLAG_MMAP only maps legacy inverted lists; MMAP_IFC maps the codes of
+        # IndexFlatCodes-based storage such as the HNSWSQ index ingest.py builds
+        faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY,
+    )
+    if index.d != EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"Vector store at {VECTOR_DB_PATH} holds {index.d}-dimensional vectors but "
+            f"embedding_dimensions is {EMBEDDING_DIMENSIONS}. Run ingest.py again."
+        )
+    # Stores built by ingest.py use an HNSW index; IVF indexes are probed per list and
+    # older flat indexes have no search knob
+    if hasattr(index, "hnsw"):
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+    elif hasattr(index, "nprobe"):
+        index.nprobe = IVF_NPROBE
+
+    # Same layout FAISS.save_local writes: (docstore, index_to_docstore_id)
+    with open(os.path.join(VECTOR_DB_PATH, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+
+    return index, docstore, index_to_docstore_id
+
+
+@functools.lru_cache(maxsize=None)
+def load_vector_store():
+    """Return the shared vector store: the loaded index searched with the shared
+    embeddings client.
+
+    The index can be loaded before forking (see ``gunicorn.conf.py``); this attaches the
+    embeddings client, and so opens its HTTP connections, in the process that uses it.
+    """
+    from langchain_community.vectorstores import FAISS
+
+    index, docstore, index_to_docstore_id = load_index()
+    return FAISS(
+        embedding_function=get_embeddings(),
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+    )
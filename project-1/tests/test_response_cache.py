@@ -0,0 +1,85 @@
+import os
+
+import numpy as np
+
+from rag_system.response_cache import ResponseCache  # type: ignore
+
+
+# Unit vectors per query; cos(a, a paraphrase) ~ 0.99, cos(a, a distant) = 0.9
+VECTORS = {
+    "a": [1.0, 0.0, 0.0],
+    "a paraphrase": [0.99, float(np.sqrt(1 - 0.99 ** 2)), 0.0],
+    "a distant": [0.9, float(np.sqrt(1 - 0.9 ** 2)), 0.0],
+    "b": [0.0, 1.0, 0.0],
+    "c": [0.0, 0.0, 1.0],
+}
+
+
+def embed_query(query):
+    return VECTORS[query]
+
+
+def answer(query):
+    return {"query": query, "answer": f"answer to {query}", "sources": []}
+
+
+def remember(cache, query, namespace="ns"):
+    _, vector = cache.lookup(namespace, query)
+    cache.store(namespace, query, answer(query), vector)
+
+
+def test_exact_tier_evicts_least_recently_used():
+    cache = ResponseCache(embed_query, max_size=2)
+    cache.store("ns", "a", answer("a"))
+    cache.store("ns", "b", answer("b"))
+    assert cache.lookup("ns", "  A ")[0] == answer("a")
+
+    cache.store("ns", "c", answer("c"))
+    assert cache.lookup("ns", "a")[0] == answer("a")
+    assert cache.lookup("ns", "b")[0] is None
+
+
+def test_semantic_hits_only_above_threshold():
+    cache = ResponseCache(embed_query, similarity_threshold=0.97)
+    remember(cache, "a")
+
+    assert cache.lookup("ns", "a paraphrase")[0] == answer("a")
+    assert cache.lookup("ns", "a distant")[0] is None
+    assert cache.lookup("other", "a paraphrase")[0] is None
+
+
+def test_semantic_tier_drops_oldest_when_full():
+    cache = ResponseCache(embed_query, max_size=2)
+    for query in ("a", "b", "c"):
+        remember(cache, query)
+
+    index, responses, _ = cache._semantic["ns"]
+    assert index.ntotal == 2
+    assert responses == [answer("b"), answer("c")]
+    assert cache.lookup("ns", "a paraphrase")[0] is None
+
+
+def test_periodic_save_includes_latest_entry(tmp_path):
+    path = str(tmp_path / "cache.pkl")
+    cache = ResponseCache(embed_query, path=path, save_every=2)
+    remember(cache, "a")
+    remember(cache, "b")
+    assert os.listdir(tmp_path) == ["cache.pkl"]
+
+    restored = ResponseCache(embed_query, path=path)
+    assert restored.load()
+    assert restored._semantic["ns"][0].ntotal == 2
+    assert restored.lookup("ns", "a paraphrase")[0] == answer("a")
+
+
+def test_load_ignores_cache_older_than_store(tmp_path):
+    path = str(tmp_path / "cache.pkl")
+    cache = ResponseCache(embed_query, path=path)
+    remember(cache, "a")
+    cache.save()
+
+    restored = ResponseCache(embed_query, path=path)
+    assert not restored.load(valid_after=os.path.getmtime(path) + 1)
+    assert restored.lookup("ns", "a")[0] is None
+    assert restored.load(valid_after=os.path.getmtime(path))
+    assert restored.lookup("ns", "a")[0] == answer("a")
@@ -1,11 +1,12 @@
 import logging
 import time
 import os
-import re
 from typing import Dict, Any, List
-from openai import OpenAI
+from clients import get_openai_client
 from config import get_config
 from prompt_utils import prompt_manager
+from utils.json_parse import extract_json_array
+from utils.sanitize import sanitize_input
 
 logger = logging.getLogger(__name__)
 
@@ -17,16 +18,7 @@ SAFETY_SYSTEM_MSG = (
 
 
 def _sanitize_text(text: str, max_len: int = 4000) -> str:
-    if not text:
-        return text
-    cleaned = re.sub(r"```[\s\S]*?```", " ", text)
-    cleaned = cleaned.replace("`", " ")
-    cleaned = re.sub(r"https?://\S+", " ", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\b[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}\b", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    if len(cleaned) > max_len:
-        cleaned = cleaned[:max_len]
-    return cleaned
+    return sanitize_input(text, max_len)
 
 
 def _sanitize_scene(scene: Dict[str, Any]) -> Dict[str, Any]:
@@ -43,7 +35,11 @@ class SceneCriticAgent:
     def __init__(self):
         self.config = get_config()
         self.mock_mode = self.config.get("mock_mode", False)
-        self.client = None if self.mock_mode else OpenAI(api_key=self.config["openai_api_key"])
+        # A stalled request is cut off and retried by _retry, rather than waiting out the
+        # shared client's 60s timeout and its own retries
+        self.client = None if self.mock_mode else get_openai_client().with_options(
+            timeout=self.config["llm_request_timeout"], max_retries=0
+        )
     
     def _retry(self, func, *args, attempts: int = 3, backoff: float = 0.5, **kwargs):
         last_exc = None
@@ -74,7 +70,11 @@ class SceneCriticAgent:
             )
             
             improved_scenes = self._parse_response(response.choices[0].message.content)
-            if not improved_scenes:
+            # All scenes are critiqued in one request; an answer that dropped or merged
+            # scenes cannot be matched back to them
+            if len(improved_scenes) != len(scenes):
+                if improved_scenes:
+                    logger.warning(f"Critique returned {len(improved_scenes)} scenes for {len(scenes)}, keeping originals")
                 improved_scenes = scenes
             logger.info(f"Improved {len(improved_scenes)} scenes")
             improved_scenes = [_sanitize_scene(s) for s in improved_scenes]
@@ -112,15 +112,7 @@ class SceneCriticAgent:
     
     def _parse_response(self, response: str) -> List[Dict[str, Any]]:
         try:
-            import json
-            start_idx = response.find('[')
-            end_idx = response.rfind(']') + 1
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = response[start_idx:end_idx]
-                scenes = json.loads(json_str)
-                return scenes
-                
+            return extract_json_array(response)
         except Exception as e:
             logger.error(f"Error parsing critic response: {e}")
             
@@ -1,14 +1,25 @@
 import logging
+import threading
 import time
 import os
-import re
+from concurrent.futures import Future
 from typing import Dict, Any, List
-from openai import OpenAI
+from clients import get_openai_client
 from config import get_config
 from prompt_utils import prompt_manager
+from utils.cache import TTLCache
+from utils.json_parse import extract_json_array
+from utils.sanitize import sanitize_input
 
 logger = logging.getLogger(__name__)
 
+_config = get_config()
+# Scenes generated for recent requests, shared by every agent instance (one per video)
+_scene_cache = TTLCache(_config["scene_cache_size"], _config["scene_cache_ttl"])
+# Generations in progress, so identical concurrent requests wait instead of repeating them
+_in_flight: Dict[tuple, Future] = {}
+_in_flight_lock = threading.Lock()
+
 SAFETY_SYSTEM_MSG = (
     "You are a helpful assistant that must follow strict safety rules: "
     "do not produce hateful, violent, sexual, harassing, self-harm, or personal data content. "
@@ -17,16 +28,7 @@ SAFETY_SYSTEM_MSG = (
 
 
 def _sanitize_text(text: str, max_len: int = 4000) -> str:
-    if not text:
-        return text
-    cleaned = re.sub(r"```[\s\S]*?```", " ", text)
-    cleaned = cleaned.replace("`", " ")
-    cleaned = re.sub(r"https?://\S+", " ", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\b[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}\b", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
-    if len(cleaned) > max_len:
-        cleaned = cleaned[:max_len]
-    return cleaned
+    return sanitize_input(text, max_len)
 
 
 def _sanitize_scene(scene: Dict[str, Any]) -> Dict[str, Any]:
@@ -43,7 +45,11 @@ class SceneGeneratorAgent:
     def __init__(self):
         self.config = get_config()
         self.mock_mode = self.config.get("mock_mode", False)
-        self.client = None if self.mock_mode else OpenAI(api_key=self.config["openai_api_key"])
+        # A stalled request is cut off and retried by _retry, rather than waiting out the
+        # shared client's 60s timeout and its own retries
+        self.client = None if self.mock_mode else get_openai_client().with_options(
+            timeout=self.config["llm_request_timeout"], max_retries=0
+        )
     
     def _retry(self, func, *args, attempts: int = 3, backoff: float = 0.5, **kwargs):
         last_exc = None
@@ -55,38 +61,82 @@ class SceneGeneratorAgent:
                 time.sleep(backoff * (2 ** i))
         raise last_exc
     
-    def generate_scenes(self, user_input: str) -> List[Dict[str, Any]]:
-        """Generate video scenes from user input."""
+    def generate_scenes(self, user_input: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """Generate video scenes from user input.
+        
+        Repeated requests (same input up to case and whitespace, same scene count and
+        duration) reuse recently generated scenes unless use_cache is False, and
+        identical requests arriving together share a single generation.
+        """
+        if self.mock_mode:
+            return self._create_fallback_scenes()
+        
         try:
-            if self.mock_mode:
-                return self._create_fallback_scenes()
-            
-            prompt = prompt_manager.get_scene_generation_prompt(
-                user_input, 
-                self.config["scene_count"], 
-                self.config["video_duration"]
+            cache_key = (
+                " ".join(user_input.lower().split()),
+                self.config["scene_count"],
+                self.config["video_duration"],
             )
+            if not use_cache:
+                return self._request_scenes(user_input, cache_key)
             
-            response = self._retry(
-                self.client.chat.completions.create,
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": SAFETY_SYSTEM_MSG},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7
-            )
+            cached = _scene_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing {len(cached)} cached scenes")
+                return [dict(scene) for scene in cached]
             
-            scenes = self._parse_response(response.choices[0].message.content)
-            logger.info(f"Generated {len(scenes)} scenes")
-            # Sanitize scenes
-            scenes = [_sanitize_scene(s) for s in scenes]
-            return scenes
+            with _in_flight_lock:
+                pending = _in_flight.get(cache_key)
+                is_owner = pending is None
+                if is_owner:
+                    pending = _in_flight[cache_key] = Future()
+            
+            if not is_owner:
+                logger.info("Waiting for an identical scene generation already in progress")
+                scenes = pending.result()
+                if scenes is None:
+                    raise RuntimeError("Shared scene generation failed")
+                return [dict(scene) for scene in scenes]
+            
+            scenes = None
+            try:
+                scenes = self._request_scenes(user_input, cache_key)
+                return scenes
+            finally:
+                with _in_flight_lock:
+                    del _in_flight[cache_key]
+                pending.set_result(None if scenes is None else [dict(scene) for scene in scenes])
             
         except Exception as e:
             logger.error(f"Error generating scenes: {e}")
             return self._create_fallback_scenes()
     
+    def _request_scenes(self, user_input: str, cache_key: tuple) -> List[Dict[str, Any]]:
+        prompt = prompt_manager.get_scene_generation_prompt(
+            user_input, 
+            self.config["scene_count"], 
+            self.config["video_duration"]
+        )
+        
+        response = self._retry(
+            self.client.chat.completions.create,
+            model="gpt-4",
+            messages=[
+                {"role": "system", "content": SAFETY_SYSTEM_MSG},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7
+        )
+        
+        scenes = self._parse_response(response.choices[0].message.content)
+        logger.info(f"Generated {len(scenes)} scenes")
+        # Sanitize scenes
+        scenes = [_sanitize_scene(s) for s in scenes]
+        if scenes:
+            # Callers may modify the scenes they get, so cache copies
+            _scene_cache.put(cache_key, [dict(scene) for scene in scenes])
+        return scenes
+    
     def _create_scene_prompt(self, user_input: str) -> str:
         return f"""
         Create {self.config['scene_count']} engaging video scenes based on this input: "{user_input}"
@@ -103,21 +153,13 @@ class SceneGeneratorAgent:
         """
     
     def _parse_response(self, response: str) -> List[Dict[str, Any]]:
+        # Raises on an unparseable reply: generate_scenes then falls back to placeholder
+        # scenes without caching them or handing them to waiting identical requests
         try:
-            import json
-            start_idx = response.find('[')
-            end_idx = response.rfind(']') + 1
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = response[start_idx:end_idx]
-                scenes = json.loads(json_str)
-                return scenes
-            else:
-                return self._create_fallback_scenes()
-                
+            return extract_json_array(response)
         except Exception as e:
             logger.error(f"Error parsing response: {e}")
-            return self._create_fallback_scenes()
+            raise
     
     def _create_fallback_scenes(self) -> List[Dict[str, Any]]:
         duration_per_scene = max(1, self.config["video_duration"] // max(1, self.config["scene_count"]))
@@ -1,8 +1,14 @@
+import functools
 import logging
 import os
-from typing import Dict, Any, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from config import get_config
+from utils.cache import TTLCache
 
 # Optional moviepy import - fallback if not available  
 try:
@@ -18,12 +24,45 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Fonts tried in order: Docker container fonts first, then system fonts (for local development)
+_FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    "/System/Library/Fonts/Arial.ttf",
+    "arial.ttf",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_font_path(configured_path: Optional[str] = None) -> Optional[str]:
+    """Return the first font that loads, trying the configured one first, or None to use
+    PIL's default font. Resolved once per process; the size does not affect whether it loads.
+    """
+    candidates = ((configured_path,) if configured_path else ()) + _FONT_CANDIDATES
+    for path in candidates:
+        try:
+            ImageFont.truetype(path, 12)
+            return path
+        except Exception:
+            continue
+    return None
+
+
+# Rendered caption frames by (text, font size, resolution), shared by identical captions
+# across scenes and requests; each 1280x720 RGB frame takes about 2.7 MB
+_caption_frames = TTLCache(max_size=16, ttl_seconds=3600)
+
+
 class VideoAgent:
     """Agent responsible for assembling the final video from scenes and audio."""
     
     def __init__(self):
         self.config = get_config()
         self.mock_mode = self.config.get("mock_mode", False)
+        # Loaded fonts by size, kept per thread since FreeType faces should not be
+        # shared between threads
+        self._thread_fonts = threading.local()
+        self._font_path = _find_font_path(self.config.get("font_path"))
         self._ensure_output_dirs()
     
     def _ensure_output_dirs(self):
@@ -40,21 +79,26 @@ class VideoAgent:
             logger.error("MoviePy not available - cannot create video")
             return ""
             
+        video_clips = []
         try:
-            video_clips = []
-            
-            for i, (scene, audio_file) in enumerate(zip(scenes, audio_files)):
-                # Create video clip for this scene
-                video_clip = self._create_scene_video(scene, audio_file, i)
-                if video_clip:
-                    video_clips.append(video_clip)
+            # Scenes are independent: rendering the caption and opening the audio
+            # (an ffmpeg subprocess) for one scene can overlap with the others
+            pairs = list(zip(scenes, audio_files))
+            max_workers = max(1, min(self.config.get("video_max_workers", 4), len(pairs)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                clips = executor.map(
+                    lambda i: self._create_scene_video(pairs[i][0], pairs[i][1], i),
+                    range(len(pairs))
+                )
+                video_clips = [clip for clip in clips if clip]
             
             if not video_clips:
                 raise ValueError("No video clips were created")
             
-            # Concatenate all video clips
+            # Concatenate all video clips. Every scene is a full-frame image of the same
+            # size, so clips are played back to back instead of composited per frame.
             logger.info(f"Concatenating {len(video_clips)} video clips")
-            final_video = concatenate_videoclips(video_clips, method="compose")
+            final_video = concatenate_videoclips(video_clips, method="chain")
             
             # Save the final video
             output_filename = f"final_video_{self._get_timestamp()}.mp4"
@@ -64,13 +108,13 @@ class VideoAgent:
             final_video.write_videofile(
                 output_path,
                 fps=24,
-                codec='libx264',
-                audio_codec='aac'
+                codec=self.config["video_codec"],
+                audio_codec='aac',
+                # Still captions compress well even with the fastest x264 presets
+                preset=self.config["video_preset"],
+                threads=os.cpu_count()
             )
             
-            # Clean up temporary clips
-            for clip in video_clips:
-                clip.close()
             final_video.close()
             
             logger.info(f"Video assembled successfully: {output_path}")
@@ -79,6 +123,14 @@ class VideoAgent:
         except Exception as e:
             logger.error(f"Error assembling video: {e}")
             return ""
+        finally:
+            # Clean up temporary clips, including each scene's audio reader (an ffmpeg
+            # subprocess), which closing the image clip leaves open
+            for clip in video_clips:
+                audio = getattr(clip, "audio", None)
+                if audio is not None:
+                    audio.close()
+                clip.close()
     
     def _create_placeholder_video(self) -> str:
         """Create a placeholder artifact to simulate a final video in mock mode."""
@@ -96,16 +148,18 @@ class VideoAgent:
             return None
             
         try:
-            # Create text image
+            # Render the caption frame in memory
             text_image = self._create_text_image(scene["caption_text"])
             
-            # Get duration from audio file if available, otherwise use default
+            # Get duration from audio file if available, otherwise use default.
+            # The file is opened (and probed by ffmpeg) once and reused as the clip's audio.
             duration = scene.get("duration", 10)
+            audio_clip = None
             if audio_file and os.path.exists(audio_file):
                 try:
                     audio_clip = AudioFileClip(audio_file)
                     duration = audio_clip.duration
-                except:
+                except Exception:
                     logger.warning(f"Could not load audio file {audio_file}, using default duration")
                     duration = 10
             
@@ -113,9 +167,8 @@ class VideoAgent:
             video_clip = ImageClip(text_image).with_duration(duration)
             
             # Add audio if available
-            if audio_file and os.path.exists(audio_file):
+            if audio_clip is not None:
                 try:
-                    audio_clip = AudioFileClip(audio_file)
                     video_clip = video_clip.with_audio(audio_clip)
                 except Exception as audio_error:
                     logger.warning(f"Could not add audio to video clip: {audio_error}")
@@ -126,112 +179,107 @@ class VideoAgent:
             logger.error(f"Error creating scene video {scene_index}: {e}")
             return None
     
-    def _create_text_image(self, text: str) -> str:
-        """Create an image with text on a white background - simple and clean."""
+    def _create_text_image(self, text: str) -> np.ndarray:
+        """Create an RGB frame with text on a white background - simple and clean."""
         try:
             # Use HD resolution
             width, height = 1280, 720
             
+            # Use a readable font size from configuration
+            font_size = self.config.get("text_font_size", 120)
+            
+            # Identical captions render to identical frames, so reuse an earlier render
+            key = (text, font_size, width, height)
+            frame = _caption_frames.get(key)
+            if frame is not None:
+                logger.info(f"Reusing text image for text: {text[:50]}...")
+                return frame
+            
             # Create white background image
             image = Image.new('RGB', (width, height), 'white')
             draw = ImageDraw.Draw(image)
+            font = self._get_font(font_size)
             
-            # Use a readable font size from configuration
-            font_size = self.config.get("text_font_size", 120)
-            try:
-                # Try fonts available in Docker container
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-            except:
-                try:
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf", font_size)
-                except:
-                    try:
-                        # Try system fonts (for local development)
-                        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-                    except:
-                        try:
-                            font = ImageFont.truetype("arial.ttf", font_size)
-                        except:
-                            # Use default but try to make it bigger
-                            font = ImageFont.load_default()
-            
-            # Wrap text to multiple lines if needed
+            # Wrap text to multiple lines if needed. Each distinct word is measured once and
+            # line widths are summed from word and space advances.
             words = text.split()
-            lines = []
+            widths_by_word = {word: draw.textlength(word, font=font) for word in set(words)}
+            word_widths = [widths_by_word[word] for word in words]
+            space_width = draw.textlength(' ', font=font)
+            lines = []  # (line text, line width)
             current_line = []
+            current_width = 0.0
             max_width = width - 100  # 50px margin on each side
             
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                try:
-                    bbox = draw.textbbox((0, 0), test_line, font=font)
-                    line_width = bbox[2] - bbox[0]
-                except:
-                    # Fallback if textbbox is not available
-                    line_width = len(test_line) * 20  # Rough estimate
+            for word, word_width in zip(words, word_widths):
+                line_width = current_width + space_width + word_width if current_line else word_width
                 
                 if line_width <= max_width:
                     current_line.append(word)
+                    current_width = line_width
                 else:
                     if current_line:
-                        lines.append(' '.join(current_line))
+                        lines.append((' '.join(current_line), current_width))
                         current_line = [word]
+                        current_width = word_width
                     else:
-                        lines.append(word)  # Single word too long, add it anyway
+                        lines.append((word, word_width))  # Single word too long, add it anyway
             
             if current_line:
-                lines.append(' '.join(current_line))
+                lines.append((' '.join(current_line), current_width))
             
             # Calculate positioning - scale line height with font size
             line_height = int(font_size * 1.5)  # 1.5x font size for good spacing
             total_height = len(lines) * line_height
             start_y = (height - total_height) // 2
             
-            # Draw each line centered
-            for i, line in enumerate(lines):
-                try:
-                    bbox = draw.textbbox((0, 0), line, font=font)
-                    text_width = bbox[2] - bbox[0]
-                except:
-                    # Fallback positioning
-                    text_width = len(line) * 20
-                
-                x = (width - text_width) // 2
+            # Draw each line centered; long captions overflow the frame, and lines entirely
+            # above or below it are not rasterized
+            for i, (line, text_width) in enumerate(lines):
+                x = (width - int(text_width)) // 2
                 y = start_y + i * line_height
+                if y + line_height <= 0 or y >= height:
+                    continue
                 
                 # Draw black text on white background
                 draw.text((x, y), line, fill='black', font=font)
             
-            # Save image
-            image_filename = f"text_scene_{self._get_timestamp()}.png"
-            image_path = os.path.join(self.config["temp_dir"], image_filename)
-            image.save(image_path)
+            # Hand the pixels to MoviePy directly instead of a PNG it would decode again
+            frame = np.asarray(image)
+            _caption_frames.put(key, frame)
             
-            logger.info(f"Created text image: {image_path} with text: {text[:50]}...")
-            return image_path
+            logger.info(f"Created text image with text: {text[:50]}...")
+            return frame
             
         except Exception as e:
             logger.error(f"Error creating text image: {e}")
             # Return a blank image as fallback
             return self._create_blank_image()
     
-    def _create_blank_image(self) -> str:
-        """Create a blank white image as fallback."""
+    def _get_font(self, font_size: int):
+        fonts = getattr(self._thread_fonts, "fonts", None)
+        if fonts is None:
+            fonts = self._thread_fonts.fonts = {}
+        font = fonts.get(font_size)
+        if font is None:
+            if self._font_path:
+                font = ImageFont.truetype(self._font_path, font_size)
+            else:
+                font = ImageFont.load_default()
+            fonts[font_size] = font
+        return font
+    
+    def _create_blank_image(self) -> Optional[np.ndarray]:
+        """Create a blank white frame as fallback."""
         try:
             width, height = map(int, self.config["video_resolution"].split('x'))
             image = Image.new('RGB', (width, height), self.config["background_color"])
-            
-            image_filename = f"blank_image_{self._get_timestamp()}.png"
-            image_path = os.path.join(self.config["temp_dir"], image_filename)
-            image.save(image_path)
-            
-            return image_path
+            return np.asarray(image)
             
         except Exception as e:
             logger.error(f"Error creating blank image: {e}")
-            return ""
+            return None
     
     def _get_timestamp(self) -> str:
         """Get current timestamp for unique filenames."""
-        import time
         return str(time.time_ns()) 
\ No newline at end of file
@@ -1,19 +1,20 @@
 import os
-import json
-import threading
+import time
 from datetime import datetime
 from typing import Dict, Any, Generator
-from flask import Flask, request, jsonify, Response, stream_template
+from flask import Flask, request, jsonify, Response, send_file, stream_template
 from flask_cors import CORS
 from werkzeug.exceptions import BadRequest, NotFound
 
 from config import get_config
-from database import db, Video, VideoProgress, DatabaseManager, init_database
+from database import db, Video, VideoProgress, DatabaseManager, init_database, videos_version
 from graph import VideoGeneratorGraph
 
 # Additional imports for validation and health checks
+import orjson
 from pydantic import BaseModel, Field, ValidationError
 from functools import lru_cache
+from urllib.parse import quote
 import os
 from sqlalchemy import text
 import json as _json
@@ -21,19 +22,32 @@ import json as _json
 # Local services and utils
 from services.moderation import _llm_moderation_flagged
 from utils.media import compute_duration_from_file
-from utils.sanitize import sanitize_input
-from services.video_generation import generate_video_async, VideoGeneratorWithProgress
+from utils.sanitize import sanitize_input, truncate_tokens
+from services.video_generation import generate_video_async, GenerationPool, VideoGeneratorWithProgress
+from services.progress import ProgressUpdates
+from utils.json_provider import OrjsonProvider
 
 
 app = Flask(__name__)
-config = get_config()
+app.json = OrjsonProvider(app)
+# The app keeps its own mutable copy of the settings
+config = dict(get_config())
 # Configure CORS based on configured origins
-CORS(app, resources={r"/api/*": {"origins": config["cors_origins"]}})
+# An any-origin policy answers with "*" directly instead of matching each Origin
+CORS(app, resources={r"/api/*": {"origins": list(config["cors_origins"])}},
+     send_wildcard="*" in config["cors_origins"])
 
 # Configure Flask app
 app.config['SQLALCHEMY_DATABASE_URI'] = config['database_url']
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if config['database_url'].startswith('sqlite'):
+    # Pooled connections are shared by request, SSE and generation threads; a writer
+    # waits up to 30s for another instead of failing with "database is locked"
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'connect_args': {'check_same_thread': False, 'timeout': 30},
+    }
 app.config['SECRET_KEY'] = config['secret_key']
+app.config['USE_X_SENDFILE'] = config['use_x_sendfile']
 
 # Initialize database
 db.init_app(app)
@@ -42,11 +56,38 @@ db_manager = DatabaseManager(db)
 # Initialize video generator
 video_generator = VideoGeneratorGraph()
 
-# Global dictionary to store SSE connections
-sse_connections = {}
+# Serialized video list as (videos_version, body), reused until a video is written
+_video_list_cache = (None, None)
+
+# (file_path, mtime) of videos ffprobe could not read, so listing does not re-probe them
+_unprobeable_files = set()
+
+# Real-time progress updates; SSE streams wait on it instead of polling
+progress_updates = ProgressUpdates()
+
+# Background workers running video generations
+generation_pool = GenerationPool(config["generation_max_workers"], config["generation_queue_size"])
+
+# Seconds between keep-alive events while a video has no news
+SSE_HEARTBEAT_SECONDS = 15
 
-# Global dictionary to store real-time progress updates
-progress_updates = {}
+# Heartbeat event shared by all SSE streams, re-rendered at most once per second
+_heartbeat_event = (0.0, b"")
+
+
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    # Bytes go to the server as they are, without a decode here and an encode there
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _heartbeat() -> bytes:
+    global _heartbeat_event
+    rendered_at, event = _heartbeat_event
+    now = time.monotonic()
+    if now - rendered_at >= 1:
+        event = _sse_event({'type': 'heartbeat', 'timestamp': datetime.utcnow().isoformat()})
+        _heartbeat_event = (now, event)
+    return event
 
 class CreateVideoPayload(BaseModel):
     title: str = Field(min_length=1, max_length=255)
@@ -57,17 +98,39 @@ class CreateVideoPayload(BaseModel):
 @app.route('/api/videos', methods=['GET'])
 def get_videos():
     """Get all videos from the database."""
+    global _video_list_cache
     try:
-        videos = db_manager.get_all_videos()
-        for video in videos:
-            if not video.duration or video.duration == 0:
-                if video.file_path and os.path.exists(video.file_path):
-                    video.duration = compute_duration_from_file(video.file_path)
-                    db.session.commit()
-        return jsonify({
+        # Read before querying: a write racing with this request leaves the entry stale
+        version = videos_version()
+        cached_version, body = _video_list_cache
+        if cached_version == version:
+            return app.response_class(body, mimetype='application/json')
+        
+        videos = db_manager.get_video_summaries()
+        # Backfill missing durations, writing them together
+        backfilled = []
+        for summary in videos:
+            if not summary['duration'] or summary['duration'] == 0:
+                if summary['file_path'] and os.path.exists(summary['file_path']):
+                    probe_key = (summary['file_path'], os.path.getmtime(summary['file_path']))
+                    if probe_key in _unprobeable_files:
+                        continue
+                    duration = compute_duration_from_file(summary['file_path'])
+                    if duration > 0:
+                        summary['duration'] = duration
+                        backfilled.append({'id': summary['id'], 'duration': duration})
+                    else:
+                        _unprobeable_files.add(probe_key)
+        if backfilled:
+            db_manager.update_video_durations(backfilled)
+            # The backfill is itself a write; cache under the version it produced
+            version = videos_version()
+        response = jsonify({
             'success': True,
-            'videos': [video.to_dict() for video in videos]
+            'videos': videos
         })
+        _video_list_cache = (version, response.get_data())
+        return response
     except Exception as e:
         return jsonify({
             'success': False,
@@ -114,7 +177,8 @@ def create_video():
         # Sanitize inputs
         title = sanitize_input(title, 255)
         description = sanitize_input(description, 2000)
-        user_input = sanitize_input(user_input, 4000)
+        # The scene prompt is billed per token, so budget it in tokens too
+        user_input = truncate_tokens(sanitize_input(user_input, 4000), 1000)
 
         # Moderation pre-filter (disabled in mock mode)
         if _llm_moderation_flagged(f"{title} {description} {user_input}"):
@@ -124,12 +188,10 @@ def create_video():
         video = db_manager.create_video(title, description, user_input)
         
         # Start video generation in background
-        thread = threading.Thread(
-            target=generate_video_async,
-            args=(app, video.id, user_input, db_manager, progress_updates)
-        )
-        thread.daemon = True
-        thread.start()
+        if not generation_pool.submit(generate_video_async, app, video.id, user_input, db_manager, progress_updates):
+            error_msg = 'Too many videos are being generated, please try again later'
+            db_manager.update_video_status(video.id, 'failed', 'failed', 0, error_msg)
+            return jsonify({'success': False, 'error': error_msg}), 503
         
         return jsonify({
             'success': True,
@@ -150,9 +212,17 @@ def create_video():
 
 @app.route('/api/videos/<video_id>/progress', methods=['GET'])
 def get_video_progress(video_id: str):
-    """Get progress history for a video."""
+    """Get progress history for a video.
+    
+    Clients polling for new entries can pass ?after_id=<last seen id>&limit=<n>.
+    """
     try:
-        progress_entries = db_manager.get_video_progress(video_id)
+        limit = request.args.get('limit', type=int)
+        progress_entries = db_manager.get_video_progress(
+            video_id,
+            after_id=request.args.get('after_id', type=int),
+            limit=None if limit is None else max(1, min(limit, 1000))
+        )
         return jsonify({
             'success': True,
             'progress': [entry.to_dict() for entry in progress_entries]
@@ -168,70 +238,74 @@ def video_events(video_id: str):
     """Server-Sent Events endpoint for real-time video generation updates."""
     def event_generator():
         """Generate SSE events for video progress."""
+        # The stream lives as long as this generator: it ends when the video is done,
+        # and the server closes it when the client disconnects
         try:
-            # Store connection for this video
-            if video_id not in sse_connections:
-                sse_connections[video_id] = []
-            
-            # Add this connection to the list
-            connection_id = len(sse_connections[video_id])
-            sse_connections[video_id].append(True)
-            
             # Send initial status with app context
             with app.app_context():
                 video = db_manager.get_video(video_id)
                 if video:
-                    yield f"data: {json.dumps({'type': 'status', 'data': video.to_dict()})}\n\n"
+                    yield _sse_event({'type': 'status', 'data': video.to_dict()})
             
             last_progress_timestamp = None
+            last_updated_at = None
+            version = progress_updates.version(video_id)
             
             # Keep connection alive and send updates
-            while sse_connections[video_id][connection_id]:
+            while True:
+                # Events of one wakeup are written to the client together
+                events = []
+                
                 # Check for real-time progress updates
-                if video_id in progress_updates:
-                    progress_update = progress_updates[video_id]
+                progress_update = progress_updates.get(video_id)
+                if progress_update:
                     if progress_update['timestamp'] != last_progress_timestamp:
                         # Send progress update with correct format
-                        yield f"data: {json.dumps({'type': 'progress', 'progress': progress_update['progress'], 'message': progress_update['message']})}\n\n"
+                        events.append(_sse_event({'type': 'progress', 'progress': progress_update['progress'], 'message': progress_update['message']}))
                         last_progress_timestamp = progress_update['timestamp']
                 
                 # Check for video updates with app context
                 with app.app_context():
                     video = db_manager.get_video(video_id)
-                    if video:
-                        yield f"data: {json.dumps({'type': 'update', 'data': video.to_dict()})}\n\n"
+                    video_data = None
+                    # Every write to the row bumps updated_at; unchanged rows are not re-sent
+                    if video and video.updated_at != last_updated_at:
+                        video_data = video.to_dict()
+                        events.append(_sse_event({'type': 'update', 'data': video_data}))
+                        last_updated_at = video.updated_at
                     
-                    # If video is completed or failed, close connection
-                    if video and video.status in ['completed', 'failed']:
+                    # If video is completed or failed, close connection (once the generation
+                    # has stored its final result, e.g. the output file)
+                    if video and video.status in ['completed', 'failed'] and not progress_updates.is_running(video_id):
                         # Send any remaining progress updates first
-                        if video_id in progress_updates:
-                            progress_update = progress_updates[video_id]
-                            yield f"data: {json.dumps({'type': 'progress', 'progress': progress_update['progress'], 'message': progress_update['message']})}\n\n"
+                        progress_update = progress_updates.get(video_id)
+                        if progress_update:
+                            events.append(_sse_event({'type': 'progress', 'progress': progress_update['progress'], 'message': progress_update['message']}))
                         
                         # Send completion event
-                        yield f"data: {json.dumps({'type': 'complete', 'data': video.to_dict()})}\n\n"
+                        events.append(_sse_event({'type': 'complete', 'data': video_data or video.to_dict()}))
+                        yield b"".join(events)
                         
-                        # Close connection
-                        sse_connections[video_id][connection_id] = False
-                        
-                        # Clean up progress updates after a small delay
-                        if video_id in progress_updates:
-                            del progress_updates[video_id]
+                        # Clean up progress updates; other streams of this video may have already
+                        progress_updates.discard(video_id)
                         break
                 
-                # Keep alive (check more frequently for real-time updates)
-                yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
+                # Keep alive
+                events.append(_heartbeat())
+                yield b"".join(events)
                 
-                # Sleep for a shorter time to get more real-time updates
-                import time
-                time.sleep(0.5)
+                # Sleep until the generation reports progress or finishes. Every database
+                # write by the generation is followed by such a change, so while there is
+                # none only heartbeats are sent and the database is not queried.
+                while True:
+                    new_version = progress_updates.wait_for_change(video_id, version, SSE_HEARTBEAT_SECONDS)
+                    if new_version != version:
+                        break
+                    yield _heartbeat()
+                version = new_version
                 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-        finally:
-            # Clean up connection
-            if video_id in sse_connections and connection_id < len(sse_connections[video_id]):
-                sse_connections[video_id][connection_id] = False
+            yield _sse_event({'type': 'error', 'message': str(e)})
     
     return Response(
         event_generator(),
@@ -274,15 +348,28 @@ def download_video(video_id: str):
                 'error': 'Video file not found on disk'
             }), 404
         
-        from flask import send_file
         # Allow inline playback if requested
         as_attachment = request.args.get('inline') not in ('1', 'true', 'yes')
-        return send_file(
+        accel_prefix = config.get('x_accel_redirect_prefix')
+        # Served as a file handle rather than read into memory: WSGI servers with
+        # wsgi.file_wrapper use sendfile(2), range requests let players seek without
+        # downloading the whole video, and with USE_X_SENDFILE the front server sends it
+        response = send_file(
             file_path,
             as_attachment=as_attachment,
             download_name=f"{video.title}.mp4",
-            mimetype='video/mp4'
+            mimetype='video/mp4',
+            conditional=not accel_prefix,
+            max_age=3600
         )
+        if accel_prefix:
+            # nginx sends the file (and answers range requests) from its internal
+            # location; only the headers built above are kept
+            response.close()
+            response.set_data(b"")
+            relative_path = os.path.relpath(file_path, outputs_root).replace(os.sep, '/')
+            response.headers['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(relative_path)
+        return response
         
     except Exception as e:
         return jsonify({
@@ -0,0 +1,27 @@
+import functools
+
+import httpx
+from openai import OpenAI
+
+from config import get_config
+
+
+@functools.lru_cache(maxsize=None)
+def _openai_client(api_key: str) -> OpenAI:
+    http_client = httpx.Client(
+        http2=True,
+        timeout=60,
+        # Keep idle connections past httpx's 5s default, so the pauses between a
+        # generation's steps (and between generations) do not cost a new handshake
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60),
+    )
+    return OpenAI(api_key=api_key, http_client=http_client)
+
+
+def get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client.
+
+    All agents share one pooled HTTP/2 connection set, so concurrent requests are
+    multiplexed and new agent instances skip the TCP and TLS handshakes.
+    """
+    return _openai_client(get_config()["openai_api_key"])
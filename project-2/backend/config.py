@@ -1,5 +1,6 @@
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,8 +20,25 @@ CONFIG: Dict[str, Any] = {
     "scene_count": int(os.getenv("SCENE_COUNT", "3")),
     "video_duration": int(os.getenv("VIDEO_DURATION", "30")),  # seconds
     "audio_voice": os.getenv("AUDIO_VOICE", "alloy"),
+    # Max concurrent narration/TTS requests per video
+    "audio_max_workers": int(os.getenv("AUDIO_MAX_WORKERS", "8")),
+    # Videos generated at once; further requests queue up to GENERATION_QUEUE_SIZE deep
+    "generation_max_workers": int(os.getenv("GENERATION_MAX_WORKERS", "2")),
+    "generation_queue_size": int(os.getenv("GENERATION_QUEUE_SIZE", "16")),
+    # Seconds before a scene generation/critique request is abandoned and retried
+    "llm_request_timeout": float(os.getenv("LLM_REQUEST_TIMEOUT", "30")),
+    # Generated scenes reused for repeated requests (0 disables the cache)
+    "scene_cache_size": int(os.getenv("SCENE_CACHE_SIZE", "128")),
+    "scene_cache_ttl": int(os.getenv("SCENE_CACHE_TTL", "3600")),  # seconds
     "video_resolution": os.getenv("VIDEO_RESOLUTION", "1280x720"),
+    # Final video encoder; e.g. h264_nvenc (with VIDEO_PRESET=fast) on NVIDIA hosts
+    "video_codec": os.getenv("VIDEO_CODEC", "libx264"),
+    "video_preset": os.getenv("VIDEO_PRESET", "veryfast"),
+    # Max scenes rendered concurrently per video
+    "video_max_workers": int(os.getenv("VIDEO_MAX_WORKERS", "4")),
     "text_font_size": int(os.getenv("TEXT_FONT_SIZE", "48")),
+    # Caption font file; unset tries DejaVu Sans, Liberation Sans and Arial
+    "font_path": os.getenv("FONT_PATH"),
     "text_color": os.getenv("TEXT_COLOR", "black"),
     "background_color": os.getenv("BACKGROUND_COLOR", "white"),
     
@@ -34,17 +52,27 @@ CONFIG: Dict[str, Any] = {
     "flask_port": int(os.getenv("FLASK_PORT", "5000")),
     "flask_debug": os.getenv("FLASK_ENV") == "development",
     "secret_key": os.getenv("SECRET_KEY", "dev-secret-key"),
+    # Let a front server that supports X-Sendfile (Apache, lighttpd) send video files
+    "use_x_sendfile": os.getenv("USE_X_SENDFILE", "false").lower() in ("1", "true", "yes"),
+    # nginx internal location aliasing the outputs dir (e.g. /internal/videos/, see
+    # nginx.example.conf); when set, downloads are handed to nginx with X-Accel-Redirect
+    "x_accel_redirect_prefix": os.getenv("X_ACCEL_REDIRECT_PREFIX", ""),
     
     # Database Settings - use absolute path for Docker compatibility
     "database_url": os.getenv("DATABASE_URL") or f"sqlite:///{os.path.abspath(os.path.join(_BASE_DIR, 'data', 'db.sqlite'))}",
     
     # CORS Settings
-    "cors_origins": [o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()],
+    # Deduplicated once here, since Flask-CORS scans the list on every request
+    "cors_origins": tuple(dict.fromkeys(o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip())),
 }
 
-def get_config() -> Dict[str, Any]:
-    """Get the configuration dictionary."""
-    return CONFIG.copy()
+# Read-only view handed to callers, so get_config() does not copy on every call
+_CONFIG_VIEW: Mapping[str, Any] = MappingProxyType(CONFIG)
+
+
+def get_config() -> Mapping[str, Any]:
+    """Get a read-only view of the configuration."""
+    return _CONFIG_VIEW
 
 
 def validate_config() -> bool:
@@ -1,9 +1,12 @@
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, Float, event, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
 
@@ -12,6 +15,8 @@ db = SQLAlchemy()
 class Video(db.Model):
     """Model for storing video metadata."""
     __tablename__ = 'videos'
+    # Video listings are ordered newest first
+    __table_args__ = (db.Index('ix_videos_created_at', 'created_at'),)
     
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
@@ -33,6 +38,10 @@ class Video(db.Model):
     improved_scenes = Column(Text)
     audio_files = Column(Text)
     
+    # Fields shown in video listings; user input and scene data stay unloaded
+    LIST_COLUMNS = ('id', 'title', 'description', 'status', 'file_path', 'duration',
+                    'created_at', 'updated_at', 'current_step', 'progress_percent', 'error_message')
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert video object to dictionary."""
         return {
@@ -55,6 +64,8 @@ class Video(db.Model):
 class VideoProgress(db.Model):
     """Model for tracking video generation progress."""
     __tablename__ = 'video_progress'
+    # Progress is read per video in time order
+    __table_args__ = (db.Index('ix_video_progress_video_id_timestamp', 'video_id', 'timestamp'),)
     
     id = Column(Integer, primary_key=True)
     video_id = Column(String(36), db.ForeignKey('videos.id'), nullable=False)
@@ -74,6 +85,59 @@ class VideoProgress(db.Model):
             'timestamp': self.timestamp.isoformat() if self.timestamp else None
         }
 
+@event.listens_for(Engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    """Use WAL with synchronous=NORMAL on SQLite: commits append to the log without an
+    fsync each, and SSE/API reads do not block on a generation's writes. Temporary
+    tables stay in memory and reads go through a memory map of up to 256 MB."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
+# Bumped after every commit that wrote a Video row, so cached video listings can tell
+# they are stale
+_videos_version = 0
+_videos_version_lock = threading.Lock()
+
+
+def videos_version() -> int:
+    """Return a counter that increases whenever committed video data changes."""
+    return _videos_version
+
+
+@event.listens_for(Session, "after_flush")
+def _note_video_writes(session, flush_context):
+    if any(isinstance(obj, Video) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info["videos_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_video_writes(orm_execute_state):
+    # UPDATE/DELETE statements bypass the flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and mapper.class_ is Video:
+            orm_execute_state.session.info["videos_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_videos_version(session):
+    global _videos_version
+    if session.info.pop("videos_changed", False):
+        with _videos_version_lock:
+            _videos_version += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_video_writes(session):
+    session.info.pop("videos_changed", None)
+
+
 class DatabaseManager:
     """Manager class for database operations."""
     
@@ -100,40 +164,58 @@ class DatabaseManager:
         """Get all videos ordered by creation date."""
         return Video.query.order_by(Video.created_at.desc()).all()
     
+    def get_video_summaries(self) -> List[Dict[str, Any]]:
+        """Get the listing fields of all videos ordered by creation date."""
+        columns = [getattr(Video, name) for name in Video.LIST_COLUMNS]
+        rows = Video.query.with_entities(*columns).order_by(Video.created_at.desc()).all()
+        summaries = []
+        for row in rows:
+            summary = row._asdict()
+            for key in ('created_at', 'updated_at'):
+                if summary[key]:
+                    summary[key] = summary[key].isoformat()
+            summaries.append(summary)
+        return summaries
+    
     def update_video_status(self, video_id: str, status: str, current_step: Optional[str] = None, 
-                           progress_percent: Optional[int] = None, error_message: Optional[str] = None) -> bool:
-        """Update video status and progress."""
-        video = self.get_video(video_id)
-        if not video:
-            return False
-        
-        video.status = status
-        video.updated_at = datetime.utcnow()
-        
+                           progress_percent: Optional[int] = None, error_message: Optional[str] = None,
+                           commit: bool = True) -> bool:
+        """Update video status and progress. With commit=False the change is left for the
+        next commit, e.g. the progress entry recorded with it."""
+        values = {'status': status, 'updated_at': datetime.utcnow()}
         if current_step:
-            video.current_step = current_step
+            values['current_step'] = current_step
         if progress_percent is not None:
-            video.progress_percent = progress_percent
+            values['progress_percent'] = progress_percent
         if error_message:
-            video.error_message = error_message
-        
-        self.db.session.commit()
-        return True
-    
-    def update_video_result(self, video_id: str, file_path: str, duration: Optional[float] = None) -> bool:
-        """Update video with final result."""
-        video = self.get_video(video_id)
-        if not video:
-            return False
-        
-        video.file_path = file_path
-        video.duration = duration
-        video.status = 'completed'
-        video.progress_percent = 100
-        video.updated_at = datetime.utcnow()
-        
+            values['error_message'] = error_message
+        return self._update_video(video_id, values, commit)
+    
+    def update_video_result(self, video_id: str, file_path: str, duration: Optional[float] = None,
+                            commit: bool = True) -> bool:
+        """Update video with final result. With commit=False the change is left for the
+        next commit."""
+        return self._update_video(video_id, {
+            'file_path': file_path,
+            'duration': duration,
+            'status': 'completed',
+            'progress_percent': 100,
+            'updated_at': datetime.utcnow(),
+        }, commit)
+    
+    def update_video_durations(self, durations: List[Dict[str, Any]]) -> None:
+        """Set the duration of several videos, given as {'id', 'duration'} dicts, with one
+        batched UPDATE and a single commit."""
+        self.db.session.execute(update(Video), durations)
         self.db.session.commit()
-        return True
+    
+    def _update_video(self, video_id: str, values: Dict[str, Any], commit: bool) -> bool:
+        """Write values to a video with a single UPDATE instead of loading the row first.
+        Copies of the video already loaded in the session are updated to match."""
+        result = self.db.session.execute(update(Video).where(Video.id == video_id).values(**values))
+        if commit:
+            self.db.session.commit()
+        return result.rowcount > 0
     
     def add_progress_entry(self, video_id: str, step: str, status: str, message: Optional[str] = None):
         """Add a progress entry."""
@@ -147,9 +229,17 @@ class DatabaseManager:
         self.db.session.commit()
         return progress
     
-    def get_video_progress(self, video_id: str) -> List[VideoProgress]:
-        """Get all progress entries for a video."""
-        return VideoProgress.query.filter_by(video_id=video_id).order_by(VideoProgress.timestamp.asc()).all()
+    def get_video_progress(self, video_id: str, after_id: Optional[int] = None,
+                           limit: Optional[int] = None) -> List[VideoProgress]:
+        """Get progress entries for a video in time order; optionally only those after
+        the entry with id after_id, and at most limit of them."""
+        query = VideoProgress.query.filter_by(video_id=video_id)
+        if after_id is not None:
+            query = query.filter(VideoProgress.id > after_id)
+        query = query.order_by(VideoProgress.timestamp.asc(), VideoProgress.id.asc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
 def init_database(app):
     """Initialize the database with the Flask app."""
@@ -159,4 +249,8 @@ def init_database(app):
     
     with app.app_context():
         db.create_all()
+        # create_all() skips tables that already exist, so add indexes introduced since
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
         print("Database initialized successfully") 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Dict, Any, List
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode
@@ -11,6 +12,24 @@ from agents.video_agent import VideoAgent
 from tools.database_tools import save_scene_progress, search_similar_videos, log_progress_event, get_video_context
 
 logger = logging.getLogger(__name__)
+
+# The diagram only depends on the workflow's structure, so it is drawn once per process
+_diagram_drawn = False
+_diagram_lock = threading.Lock()
+
+
+def _draw_diagram(graph) -> None:
+    global _diagram_drawn
+    with _diagram_lock:
+        if _diagram_drawn:
+            return
+        _diagram_drawn = True
+    try:
+        graph.get_graph().draw_mermaid_png(output_file_path="graph.png")
+    except Exception as e:
+        logger.warning(f"Failed to draw workflow diagram: {e}")
+
+
 class VideoGeneratorGraph:
     """LangGraph workflow for video generation."""
     
@@ -27,7 +46,7 @@ class VideoGeneratorGraph:
 
 
         # draw the mermaid diagram
-        self.graph.get_graph().draw_mermaid_png(output_file_path="graph.png")
+        _draw_diagram(self.graph)
     
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph workflow."""
@@ -108,18 +127,9 @@ class VideoGeneratorGraph:
                 logger.warning(f"Failed to search similar videos: {e}")
             
             # Generate scenes (could potentially use similar_videos for inspiration)
-            raw_scenes = self.scene_generator.generate_scenes(user_input)
-            
-            # Save scenes to database
-            if self.video_id and raw_scenes:
-                try:
-                    save_scene_progress.invoke({
-                        "video_id": self.video_id,
-                        "scenes": raw_scenes,
-                        "step": "raw_scenes"
-                    })
-                except Exception as e:
-                    logger.warning(f"Failed to save scenes: {e}")
+            # Retries were requested by the critic, so they must not reuse cached scenes
+            raw_scenes = self.scene_generator.generate_scenes(user_input, use_cache=retry_count == 0)
+            # The database_logging node that follows saves the scenes
             
             # Send completion update
             if self.progress_callback:
@@ -0,0 +1,25 @@
+"""
+Gunicorn settings for serving the API in production:
+
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('PORT', os.getenv('FLASK_PORT', '5000'))}"
+
+# Generation jobs, their in-memory progress and the SSE streams waiting on it all
+# live in one process, so scale with threads rather than worker processes. Threads
+# (not gevent) also keep the CPU-bound video assembly from stalling other requests.
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "64"))
+
+# SSE streams hold a thread each and send a heartbeat every 15s; the worker timeout
+# only covers the worker's own liveness, not request duration, with gthread
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
@@ -4,7 +4,8 @@ Prompt template construction functions for building modular prompts for video ge
 
 import yaml
 import os
-from typing import Union, List, Optional, Dict, Any
+import orjson
+from typing import Union, List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 
@@ -178,9 +179,14 @@ def print_prompt_preview(prompt: str, max_length: int = 500) -> None:
 class PromptManager:
     """Manager class for loading and building prompts from configuration files."""
     
+    # Stands in for the content while a prompt template is prebuilt
+    _CONTENT_SLOT = "\x00CONTENT\x00"
+    
     def __init__(self):
         self.app_config = self._load_app_config()
         self.prompt_config = self._load_prompt_config()
+        # (agent_name, reasoning_strategy) -> prompt text before and after the content
+        self._templates: Dict[Tuple[str, Optional[str]], Tuple[str, str]] = {}
     
     def _load_app_config(self) -> Dict[str, Any]:
         """Load application configuration."""
@@ -218,6 +224,25 @@ class PromptManager:
         if agent_name not in self.prompt_config:
             raise ValueError(f"Agent '{agent_name}' not found in prompt configuration")
         
+        if not input_data:
+            return build_prompt_from_config(
+                self._agent_config(agent_name, reasoning_strategy), input_data, self.app_config
+            )
+        
+        # Only the content varies between calls, so the rest of the prompt is built once
+        key = (agent_name, reasoning_strategy)
+        template = self._templates.get(key)
+        if template is None:
+            prompt = build_prompt_from_config(
+                self._agent_config(agent_name, reasoning_strategy), self._CONTENT_SLOT, self.app_config
+            )
+            head, _, tail = prompt.partition(self._CONTENT_SLOT)
+            template = self._templates[key] = (head, tail)
+        
+        head, tail = template
+        return f"{head}{input_data.strip()}{tail}"
+    
+    def _agent_config(self, agent_name: str, reasoning_strategy: Optional[str]) -> Dict[str, Any]:
         config = self.prompt_config[agent_name].copy()
         
         # Add reasoning strategy from app config or override
@@ -228,7 +253,7 @@ class PromptManager:
             common_config = self.prompt_config.get("common", {})
             config["reasoning_strategy"] = common_config.get("reasoning_strategy", "step_by_step")
         
-        return build_prompt_from_config(config, input_data, self.app_config)
+        return config
     
     def get_scene_generation_prompt(self, user_input: str, scene_count: int = 3, 
                                   video_duration: int = 30) -> str:
@@ -260,8 +285,7 @@ DURATION PER SCENE: Approximately {video_duration // scene_count} seconds each
         Returns:
             A constructed prompt for scene critique.
         """
-        import json
-        scenes_json = json.dumps(scenes, indent=2)
+        scenes_json = orjson.dumps(scenes, option=orjson.OPT_INDENT_2).decode()
         input_data = f"SCENES TO REVIEW:\n{scenes_json}"
         
         return self.get_prompt_for_agent("scene_critic", input_data)
@@ -283,6 +307,28 @@ DURATION: {scene.get('duration', 10)} seconds
         
         return self.get_prompt_for_agent("audio_generation", input_data)
     
+    def get_batch_audio_generation_prompt(self, scenes: List[Dict[str, Any]]) -> str:
+        """Get a prompt for generating narration for all scenes in one request.
+        
+        Args:
+            scenes: List of scene dictionaries containing description and caption.
+            
+        Returns:
+            A constructed prompt asking for a JSON array of narrations.
+        """
+        scene_blocks = "\n".join(
+            f"""
+SCENE {i}:
+SCENE DESCRIPTION: {scene.get('description', '')}
+CAPTION TEXT: {scene.get('caption_text', '')}
+DURATION: {scene.get('duration', 10)} seconds
+"""
+            for i, scene in enumerate(scenes, 1)
+        )
+        input_data = f"SCENE COUNT: {len(scenes)}\n{scene_blocks}"
+        
+        return self.get_prompt_for_agent("audio_generation_batch", input_data)
+    
     def get_video_assembly_prompt(self, scenes: List[Dict[str, Any]], 
                                  audio_files: List[str]) -> str:
         """Get a prompt for video assembly.
@@ -294,10 +340,9 @@ DURATION: {scene.get('duration', 10)} seconds
         Returns:
             A constructed prompt for video assembly.
         """
-        import json
         input_data = f"""
-SCENES: {json.dumps(scenes, indent=2)}
-AUDIO FILES: {json.dumps(audio_files, indent=2)}
+SCENES: {orjson.dumps(scenes, option=orjson.OPT_INDENT_2).decode()}
+AUDIO FILES: {orjson.dumps(audio_files, option=orjson.OPT_INDENT_2).decode()}
 """
         
         return self.get_prompt_for_agent("video_assembly", input_data)
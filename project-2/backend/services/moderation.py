@@ -1,6 +1,12 @@
+import hashlib
 import os
 from config import get_config
-from openai import OpenAI
+from clients import get_openai_client
+from utils.cache import TTLCache
+
+# Verdicts by SHA-256 of the moderated text, so resubmitting the same content
+# (e.g. after fixing a validation error) skips the moderation round-trip
+_verdicts = TTLCache(max_size=4096, ttl_seconds=3600)
 
 
 def _llm_moderation_flagged(text: str) -> bool:
@@ -9,15 +15,22 @@ def _llm_moderation_flagged(text: str) -> bool:
         cfg = get_config()
         if not cfg.get("openai_api_key"):
             return False
-        client = OpenAI(api_key=cfg["openai_api_key"])
+        key = hashlib.sha256(text.encode("utf-8")).digest()
+        flagged = _verdicts.get(key)
+        if flagged is not None:
+            return flagged
+        client = get_openai_client()
         resp = client.moderations.create(model="omni-moderation-latest", input=text)
         result = resp.results[0]
+        flagged = bool(getattr(result, "flagged", False))
         min_score = float(os.getenv("MODERATION_MIN_SCORE", "0.08"))
         scores = getattr(result, "category_scores", None)
         if scores:
             max_score = max(getattr(scores, k) for k in scores.__dict__.keys() if not k.startswith("_"))
             if max_score >= min_score:
-                return True
-        return bool(getattr(result, "flagged", False))
+                flagged = True
+        # Only answers from the API are cached; errors fall through uncached
+        _verdicts.put(key, flagged)
+        return flagged
     except Exception:
-        return False 
\ No newline at end of file
+        return False
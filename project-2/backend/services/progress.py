@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Any, Dict
+
+
+class ProgressUpdates(dict):
+    """Latest progress update per video id.
+
+    Storing an update, or marking a generation finished, wakes the SSE streams
+    waiting on that video, so they do not have to poll for changes. Finished
+    videos are forgotten retention_seconds after they finish, whether or not a
+    stream saw the end, so the mapping does not grow with uptime.
+    """
+
+    def __init__(self, retention_seconds: float = 300):
+        super().__init__()
+        self.retention_seconds = retention_seconds
+        self._changed = threading.Condition()
+        self._versions: Dict[str, int] = {}
+        self._running = set()
+        self._finished_at: Dict[str, float] = {}
+
+    def __setitem__(self, video_id: str, update: Dict[str, Any]) -> None:
+        with self._changed:
+            super().__setitem__(video_id, update)
+            self._bump(video_id)
+
+    def _bump(self, video_id: str) -> None:
+        self._versions[video_id] = self._versions.get(video_id, 0) + 1
+        self._changed.notify_all()
+
+    def start(self, video_id: str) -> None:
+        """Mark a video's generation as running."""
+        with self._changed:
+            self._running.add(video_id)
+            self._finished_at.pop(video_id, None)
+            self._bump(video_id)
+
+    def finish(self, video_id: str) -> None:
+        """Mark a video's generation as done, once its final state is stored."""
+        with self._changed:
+            self._running.discard(video_id)
+            now = time.monotonic()
+            self._finished_at[video_id] = now
+            self._bump(video_id)
+            self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        expired = [
+            video_id for video_id, finished_at in self._finished_at.items()
+            if now - finished_at > self.retention_seconds
+        ]
+        for video_id in expired:
+            self._forget(video_id)
+
+    def discard(self, video_id: str) -> None:
+        """Forget a finished video's last update and change counter."""
+        with self._changed:
+            if video_id in self._running:
+                return
+            self._forget(video_id)
+
+    def _forget(self, video_id: str) -> None:
+        self.pop(video_id, None)
+        self._finished_at.pop(video_id, None)
+        if self._versions.pop(video_id, None) is not None:
+            # Streams still waiting on the video see the reset as a change
+            self._changed.notify_all()
+
+    def is_running(self, video_id: str) -> bool:
+        with self._changed:
+            return video_id in self._running
+
+    def version(self, video_id: str) -> int:
+        """Return a counter that increases with every change for the video."""
+        with self._changed:
+            return self._versions.get(video_id, 0)
+
+    def wait_for_change(self, video_id: str, version: int, timeout: float) -> int:
+        """Block until the video changes past version or timeout expires; return the current version."""
+        with self._changed:
+            self._changed.wait_for(lambda: self._versions.get(video_id, 0) != version, timeout)
+            return self._versions.get(video_id, 0)
@@ -1,8 +1,12 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 
 from graph import VideoGeneratorGraph
+from services.progress import ProgressUpdates
+from utils.media import compute_duration_from_file
 
 
 class VideoGeneratorWithProgress:
@@ -18,13 +22,13 @@ class VideoGeneratorWithProgress:
         """Send SSE update to connected clients and persist progress."""
         try:
             if step == 'completed':
-                self.db_manager.update_video_status(self.video_id, 'completed', step, progress)
+                self.db_manager.update_video_status(self.video_id, 'completed', step, progress, commit=False)
                 self.db_manager.add_progress_entry(self.video_id, step, 'completed', message)
             elif step in ['failed', 'video_assembly_failed', 'scene_generation_failed', 'scene_critique_failed', 'audio_generation_failed']:
-                self.db_manager.update_video_status(self.video_id, 'failed', step, progress)
+                self.db_manager.update_video_status(self.video_id, 'failed', step, progress, commit=False)
                 self.db_manager.add_progress_entry(self.video_id, step, 'failed', message)
             else:
-                self.db_manager.update_video_status(self.video_id, 'processing', step, progress)
+                self.db_manager.update_video_status(self.video_id, 'processing', step, progress, commit=False)
                 self.db_manager.add_progress_entry(self.video_id, step, 'started', message)
 
             self.progress_updates[self.video_id] = {
@@ -52,11 +56,12 @@ class VideoGeneratorWithProgress:
             raise e
 
 
-def generate_video_async(app, video_id: str, user_input: str, db_manager, progress_updates: Dict[str, Dict[str, Any]]) -> None:
+def generate_video_async(app, video_id: str, user_input: str, db_manager, progress_updates: ProgressUpdates) -> None:
     """Generate video asynchronously and update database within Flask app context."""
+    progress_updates.start(video_id)
     with app.app_context():
         try:
-            db_manager.update_video_status(video_id, 'processing', 'initializing', 0)
+            db_manager.update_video_status(video_id, 'processing', 'initializing', 0, commit=False)
             db_manager.add_progress_entry(video_id, 'initialization', 'started', 'Starting video generation')
 
             workflow_with_progress = VideoGeneratorWithProgress(video_id, db_manager, progress_updates)
@@ -64,14 +69,8 @@ def generate_video_async(app, video_id: str, user_input: str, db_manager, progre
 
             final_video_path = result.get('final_video')
             if final_video_path and os.path.exists(final_video_path):
-                duration = None
-                try:
-                    import moviepy.editor as mp
-                    video_clip = mp.VideoFileClip(final_video_path)
-                    duration = video_clip.duration
-                    video_clip.close()
-                except Exception:
-                    pass
+                # Stored with the result, so listing videos does not have to probe the file
+                duration = compute_duration_from_file(final_video_path)
 
                 if not duration:
                     scenes = result.get('improved_scenes') or result.get('raw_scenes') or []
@@ -80,13 +79,39 @@ def generate_video_async(app, video_id: str, user_input: str, db_manager, progre
                     except Exception:
                         duration = 0.0
 
-                db_manager.update_video_result(video_id, final_video_path, duration or 0.0)
+                db_manager.update_video_result(video_id, final_video_path, duration or 0.0, commit=False)
                 db_manager.add_progress_entry(video_id, 'completion', 'completed', 'Video generation completed successfully')
             else:
                 error_msg = result.get('error', 'Unknown error occurred')
-                db_manager.update_video_status(video_id, 'failed', 'failed', 100, error_msg)
+                db_manager.update_video_status(video_id, 'failed', 'failed', 100, error_msg, commit=False)
                 db_manager.add_progress_entry(video_id, 'completion', 'failed', f'Video generation failed: {error_msg}')
         except Exception as e:
             error_msg = str(e)
-            db_manager.update_video_status(video_id, 'failed', 'failed', 100, error_msg)
-            db_manager.add_progress_entry(video_id, 'completion', 'failed', f'Video generation failed: {error_msg}') 
\ No newline at end of file
+            db_manager.update_video_status(video_id, 'failed', 'failed', 100, error_msg, commit=False)
+            db_manager.add_progress_entry(video_id, 'completion', 'failed', f'Video generation failed: {error_msg}')
+        finally:
+            progress_updates.finish(video_id)
+
+
+class GenerationPool:
+    """Fixed set of worker threads for video generations, with a bounded backlog.
+
+    Generations beyond max_workers wait in the queue; once max_pending are waiting,
+    submit() refuses new work instead of piling more OpenAI and ffmpeg load on the host.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="video-generation")
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> bool:
+        """Queue fn(*args); return False if the pool is full."""
+        if not self._slots.acquire(blocking=False):
+            return False
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return True
@@ -86,6 +86,70 @@ class TestVideoListingEndpoints:
         except Exception as e:
             pytest.fail(f"Video listing failed with error: {e}")
 
+    def test_get_videos_reflects_writes(self, client_app):
+        """Test that the cached video list is refreshed after videos are written."""
+        app, client = client_app
+
+        client.get('/api/videos')
+        with app.app_context():
+            dbm = DatabaseManager(db)
+            video_id = dbm.create_video('ListingTest', 'Description', 'Input').id
+
+        ids = [v['id'] for v in client.get('/api/videos').get_json()['videos']]
+        assert video_id in ids, "Newly created video should be listed"
+
+        with app.app_context():
+            DatabaseManager(db).update_video_status(video_id, 'failed', 'failed', 100, 'boom')
+        videos = {v['id']: v for v in client.get('/api/videos').get_json()['videos']}
+        assert videos[video_id]['status'] == 'failed', "Status change should be listed"
+
+        client.delete(f'/api/videos/{video_id}')
+        ids = [v['id'] for v in client.get('/api/videos').get_json()['videos']]
+        assert video_id not in ids, "Deleted video should not be listed"
+
+    def test_get_videos_backfills_durations_once(self, client_app, monkeypatch, tmp_path):
+        """Test that probed durations are stored once and failed probes are not retried."""
+        import api as api_module  # type: ignore
+        app, client = client_app
+        probes = []
+        durations = {'good.mp4': 12.5, 'broken.mp4': 0.0}
+
+        def fake_probe(file_path):
+            name = os.path.basename(file_path)
+            if name in durations:
+                probes.append(name)
+            return durations.get(name, 0.0)
+
+        monkeypatch.setattr(api_module, 'compute_duration_from_file', fake_probe)
+        with app.app_context():
+            dbm = DatabaseManager(db)
+            ids = {}
+            for name in durations:
+                (tmp_path / name).write_bytes(b'fake mp4 data')
+                video = dbm.create_video(name, 'Description', 'Input')
+                video.file_path = str(tmp_path / name)
+                ids[name] = video.id
+            db.session.commit()
+
+        try:
+            videos = {v['id']: v for v in client.get('/api/videos').get_json()['videos']}
+            assert videos[ids['good.mp4']]['duration'] == 12.5
+            assert sorted(probes) == ['broken.mp4', 'good.mp4']
+
+            summaries = MagicMock(wraps=api_module.db_manager.get_video_summaries)
+            monkeypatch.setattr(api_module.db_manager, 'get_video_summaries', summaries)
+            client.get('/api/videos')
+            assert summaries.call_count == 0, "Backfill write should not invalidate its own listing"
+
+            with app.app_context():
+                DatabaseManager(db).update_video_status(ids['good.mp4'], 'completed', 'done', 100)
+            client.get('/api/videos')
+            assert summaries.call_count == 1
+            assert sorted(probes) == ['broken.mp4', 'good.mp4'], "Failed probe should not be retried"
+        finally:
+            for video_id in ids.values():
+                client.delete(f'/api/videos/{video_id}')
+
     def test_get_video_not_found(self, client_app):
         """Test retrieval of non-existent video."""
         app, client = client_app
@@ -356,6 +420,40 @@ class TestVideoProgressEndpoints:
             pytest.fail(f"Invalid video progress test failed with error: {e}")
 
 
+class TestVideoDownloadEndpoints:
+    """Test suite for video download endpoints."""
+
+    def test_download_handed_to_nginx_with_x_accel_redirect(self, client_app, monkeypatch):
+        """Test that a configured X-Accel-Redirect prefix replaces the body with the header."""
+        import api as api_module  # type: ignore
+        app, client = client_app
+        monkeypatch.setitem(api_module.config, 'x_accel_redirect_prefix', '/internal/videos/')
+
+        file_path = os.path.join(get_config()['output_dir'], 'x accel test.mp4')
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(b'fake mp4 data')
+        try:
+            with app.app_context():
+                dbm = DatabaseManager(db)
+                video = dbm.create_video('Café tour', 'Description', 'Input')
+                video_id = video.id
+                video.file_path = file_path
+                db.session.commit()
+
+            response = client.get(f'/api/videos/{video_id}/download')
+
+            assert response.status_code == 200
+            assert response.data == b''
+            assert response.headers['X-Accel-Redirect'] == '/internal/videos/x%20accel%20test.mp4'
+            disposition = response.headers['Content-Disposition']
+            assert disposition.startswith('attachment;')
+            assert "filename*=UTF-8''Caf%C3%A9%20tour.mp4" in disposition
+            assert response.mimetype == 'video/mp4'
+        finally:
+            os.remove(file_path)
+
+
 class TestAPIErrorHandling:
     """Test suite for general API error handling."""
 
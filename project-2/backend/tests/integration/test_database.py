@@ -3,7 +3,7 @@ import pytest
 
 os.environ.setdefault("MOCK_MODE", "true")
 from api import create_app  # type: ignore
-from database import db, DatabaseManager
+from database import db, DatabaseManager, Video, videos_version
 
 
 @pytest.fixture(scope="module")
@@ -45,4 +45,47 @@ def test_database_crud(app_ctx):
     # progress list
     entries = dbm.get_video_progress(v.id)
     assert isinstance(entries, list)
-    assert len(entries) >= 1 
\ No newline at end of file
+    assert len(entries) >= 1 
+
+def test_progress_pagination(app_ctx):
+    dbm = DatabaseManager(db)
+    v = dbm.create_video("Paged", "Desc", "Input")
+    ids = [dbm.add_progress_entry(v.id, f"step{i}", 'started', 'msg').id for i in range(5)]
+
+    first = dbm.get_video_progress(v.id, limit=2)
+    assert [e.id for e in first] == ids[:2]
+
+    rest = dbm.get_video_progress(v.id, after_id=first[-1].id)
+    assert [e.id for e in rest] == ids[2:]
+
+
+def test_video_summaries_skip_scene_data(app_ctx):
+    dbm = DatabaseManager(db)
+    v = dbm.create_video("Summary", "Desc", "Input")
+    v.raw_scenes = '[{"scene": 1}]'
+    db.session.commit()
+
+    summary = next(s for s in dbm.get_video_summaries() if s['id'] == v.id)
+    assert set(summary) == set(Video.LIST_COLUMNS)
+    assert summary['title'] == "Summary"
+    assert summary['created_at'] == v.created_at.isoformat()
+
+
+def test_status_updates_reach_loaded_videos(app_ctx):
+    dbm = DatabaseManager(db)
+    v = dbm.create_video("Loaded", "Desc", "Input")
+    assert dbm.update_video_status(v.id, 'processing', 'scenes', 40)
+    assert (v.status, v.current_step, v.progress_percent) == ('processing', 'scenes', 40)
+    assert not dbm.update_video_status("missing", 'failed')
+
+
+def test_update_video_durations_in_one_batch(app_ctx):
+    dbm = DatabaseManager(db)
+    first = dbm.create_video("First", "Desc", "Input").id
+    second = dbm.create_video("Second", "Desc", "Input").id
+    version = videos_version()
+
+    dbm.update_video_durations([{'id': first, 'duration': 12.5}, {'id': second, 'duration': 30.0}])
+    db.session.expire_all()
+    assert (dbm.get_video(first).duration, dbm.get_video(second).duration) == (12.5, 30.0)
+    assert videos_version() != version
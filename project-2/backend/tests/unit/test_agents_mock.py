@@ -173,6 +173,11 @@ class TestAudioAgent:
         except Exception as e:
             pytest.fail(f"Empty scenes handling failed: {e}")
 
+    def test_audio_agent_strips_speech_markup(self):
+        """Test that narration markup is not read aloud."""
+        narration = self.agent._create_narration_text({"caption_text": "**Bold** [claim] # here"})
+        assert narration == "Bold claim  here."
+
     def test_audio_agent_malformed_scenes_handling(self):
         """Test audio agent behavior with malformed scene data."""
         malformed_scenes = [
@@ -0,0 +1,28 @@
+import threading
+
+from services.video_generation import GenerationPool  # type: ignore
+
+
+def test_pool_refuses_work_beyond_workers_and_backlog():
+    pool = GenerationPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+    ran = []
+
+    assert pool.submit(release.wait)
+    assert pool.submit(ran.append, "queued")
+    assert not pool.submit(ran.append, "rejected")
+
+    release.set()
+    pool._executor.shutdown(wait=True)
+    assert ran == ["queued"]
+
+
+def test_pool_frees_slots_when_work_finishes():
+    pool = GenerationPool(max_workers=1, max_pending=0)
+    done = threading.Event()
+
+    assert pool.submit(done.set)
+    assert done.wait(timeout=5)
+    pool._executor.shutdown(wait=True)
+    # The done callback has released the slot once shutdown returns
+    assert pool._slots.acquire(blocking=False)
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from services.progress import ProgressUpdates  # type: ignore
+
+
+def test_wait_returns_when_update_is_stored():
+    updates = ProgressUpdates()
+    version = updates.version("v1")
+
+    def publish():
+        time.sleep(0.1)
+        updates["v1"] = {"progress": 50, "message": "halfway", "timestamp": "t1"}
+
+    threading.Thread(target=publish).start()
+    start = time.monotonic()
+    new_version = updates.wait_for_change("v1", version, timeout=5)
+    assert new_version != version
+    assert time.monotonic() - start < 2
+    assert updates["v1"]["progress"] == 50
+
+
+def test_wait_times_out_without_changes_to_that_video():
+    updates = ProgressUpdates()
+    version = updates.version("v1")
+    updates["other"] = {"progress": 10, "message": "", "timestamp": "t1"}
+    assert updates.wait_for_change("v1", version, timeout=0.05) == version
+
+
+def test_start_and_finish_track_running_generations():
+    updates = ProgressUpdates()
+    updates.start("v1")
+    assert updates.is_running("v1")
+    version = updates.version("v1")
+    updates.finish("v1")
+    assert not updates.is_running("v1")
+    assert updates.version("v1") != version
+
+
+def test_discard_forgets_finished_videos_only():
+    updates = ProgressUpdates()
+    updates.start("v1")
+    updates["v1"] = {"progress": 50, "message": "halfway", "timestamp": "t1"}
+    updates.discard("v1")
+    assert "v1" in updates
+
+    updates.finish("v1")
+    updates.discard("v1")
+    assert "v1" not in updates
+    assert updates.version("v1") == 0
+
+
+def test_finished_videos_expire_without_a_stream():
+    updates = ProgressUpdates(retention_seconds=0)
+    updates.start("v1")
+    updates["v1"] = {"progress": 100, "message": "done", "timestamp": "t1"}
+    updates.finish("v1")
+    updates.start("v2")
+    assert "v1" in updates
+
+    time.sleep(0.01)
+    updates.finish("v2")
+    assert "v1" not in updates
+    assert updates.version("v1") == 0
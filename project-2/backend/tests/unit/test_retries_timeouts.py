@@ -73,6 +73,17 @@ def test_scene_critic_retries(monkeypatch):
     assert flaky.calls >= 2
 
 
+def test_scene_critic_keeps_originals_when_scene_count_changes(monkeypatch):
+    sc = SceneCriticAgent()
+    monkeypatch.setattr(sc, "mock_mode", False)
+    monkeypatch.setattr(sc, "client", make_mock_chat(Flaky(succeed_on=1)))
+    scenes = [
+        {"description": "first", "caption_text": "first caption", "duration": 5},
+        {"description": "second", "caption_text": "second caption", "duration": 5},
+    ]
+    assert sc.improve_scenes(scenes) == scenes
+
+
 def test_audio_agent_tts_retries(monkeypatch, tmp_path):
     aa = AudioAgent()
     monkeypatch.setattr(aa, "mock_mode", False)
@@ -82,4 +93,80 @@ def test_audio_agent_tts_retries(monkeypatch, tmp_path):
     monkeypatch.setattr(aa, "client", make_mock_tts(flaky_tts, chat_resp))
     files = aa.generate_audio([{ "description": "d", "caption_text": "adequate caption", "duration": 1 }])
     assert len(files) == 1
-    assert flaky_tts.calls >= 2 
\ No newline at end of file
+    assert flaky_tts.calls >= 2 
+
+def test_audio_agent_narrates_per_scene_when_batch_does_not_fit(monkeypatch):
+    aa = AudioAgent()
+    monkeypatch.setattr(aa, "mock_mode", False)
+    scenes = [{"description": "d", "caption_text": "adequate caption", "duration": 1}] * 2
+    monkeypatch.setattr(aa, "_generate_audio_for_scene",
+                        lambda scene, i, narration=None: (i, narration))
+
+    # A non-string item falls back for its own scene only
+    monkeypatch.setattr(aa, "_stream_narrations", lambda s: iter(["first", {"text": "second"}]))
+    assert aa.generate_audio(scenes) == [(0, "first"), (1, None)]
+
+    # Fewer or extra items than scenes fall back for every scene
+    for items in (["only one"], ["one", "two", "three"]):
+        monkeypatch.setattr(aa, "_stream_narrations", lambda s: iter(items))
+        assert aa.generate_audio(scenes) == [(0, None), (1, None)]
+
+
+def test_scene_generator_reuses_cached_scenes(monkeypatch):
+    sg = SceneGeneratorAgent()
+    calls = Flaky(succeed_on=1)
+    monkeypatch.setattr(sg, "mock_mode", False)
+    monkeypatch.setattr(sg, "client", make_mock_chat(calls))
+    first = sg.generate_scenes("A cached   Topic")
+    first[0]["caption_text"] = "changed by caller"
+    second = sg.generate_scenes("a cached topic")
+    assert calls.calls == 1
+    assert second[0]["caption_text"] == "adequate caption"
+    sg.generate_scenes("a cached topic", use_cache=False)
+    assert calls.calls == 2
+
+
+def test_scene_generator_does_not_cache_fallback_scenes(monkeypatch):
+    sg = SceneGeneratorAgent()
+    replies = iter(["not json at all", Flaky(succeed_on=1)().choices[0].message.content])
+    calls = []
+
+    def create(*args, **kwargs):
+        calls.append(1)
+        content = next(replies)
+        return type("R", (), {"choices": [type("C", (), {"message": type("M", (), {"content": content})()})]})()
+
+    monkeypatch.setattr(sg, "mock_mode", False)
+    monkeypatch.setattr(sg, "client", make_mock_chat(create))
+    first = sg.generate_scenes("an unparseable topic")
+    assert first[0]["caption_text"].startswith("Mock Scene")
+    second = sg.generate_scenes("an unparseable topic")
+    assert len(calls) == 2
+    assert second[0]["caption_text"] == "adequate caption"
+
+
+def test_scene_generator_shares_concurrent_identical_requests(monkeypatch):
+    import threading
+    import time
+
+    sg = SceneGeneratorAgent()
+    inner = Flaky(succeed_on=1)
+
+    def slow_create(*args, **kwargs):
+        time.sleep(0.2)
+        return inner(*args, **kwargs)
+
+    monkeypatch.setattr(sg, "mock_mode", False)
+    monkeypatch.setattr(sg, "client", make_mock_chat(slow_create))
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(sg.generate_scenes("a shared topic")))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert inner.calls == 1
+    assert len(results) == 3
+    assert all(r[0]["caption_text"] == "adequate caption" for r in results)
@@ -14,7 +14,7 @@ class StubClip:
     def with_audio(self, a):
         self._audio = a
         return self
-    def write_videofile(self, path, fps=24, codec='libx264', audio_codec='aac'):
+    def write_videofile(self, path, fps=24, codec='libx264', audio_codec='aac', **kwargs):
         # Create an empty file to simulate output
         with open(path, 'wb') as f:
             f.write(b'video')
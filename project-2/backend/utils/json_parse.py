@@ -0,0 +1,51 @@
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+import orjson
+
+# Greedy and DOTALL: spans from the first "[" to the last "]" of the reply
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+
+def extract_json_array(text: str) -> Any:
+    """Parse the JSON array embedded in a model reply, ignoring any surrounding prose.
+    Raises ValueError if the reply holds no array or the array is not valid JSON.
+    """
+    match = _JSON_ARRAY_RE.search(text or "")
+    if match is None:
+        raise ValueError("No JSON array found in response")
+    return orjson.loads(match.group(0))
+
+
+def iter_json_array_items(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yield the items of a JSON array as soon as each one is complete in a stream of
+    text chunks (e.g. streamed model output). Text before the opening "[" is ignored;
+    iteration stops at the closing "]" or when the chunks run out.
+    """
+    buffer = ""
+    pos = None
+    for chunk in chunks:
+        buffer += chunk
+        if pos is None:
+            start = buffer.find("[")
+            if start == -1:
+                continue
+            pos = start + 1
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = _DECODER.raw_decode(buffer, pos)
+            except ValueError:
+                break  # item not complete yet
+            # A scalar ending at the buffer edge may still be cut short ("12" of "123")
+            if end == len(buffer) and not isinstance(item, (str, list, dict)):
+                break
+            yield item
+            pos = end
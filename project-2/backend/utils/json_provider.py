@@ -0,0 +1,25 @@
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify and request.get_json skip the
+    stdlib encoder. Types orjson does not know fall back to Flask's default handling.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=_DUMP_OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=_DUMP_OPTIONS),
+            mimetype=self.mimetype,
+        )
@@ -18,7 +18,9 @@ def compute_duration_from_file(file_path: str) -> float:
                 ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                text=True,
+                # Only the container header is read; a stuck probe must not hang a request
+                timeout=10
             )
             if result.returncode == 0:
                 try:
@@ -1,5 +1,16 @@
+import functools
+import logging
 import re
 
+logger = logging.getLogger(__name__)
+
+# Code fences, stray backticks, URLs and email addresses, removed in one pass.
+# URLs stop at a backtick, as they did when backticks were blanked out first.
+_SCRUB_RE = re.compile(
+    r"```[\s\S]*?```|`|https?://[^\s`]+|\b[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}\b",
+    re.IGNORECASE,
+)
+
 
 def sanitize_input(text: str, max_len: int) -> str:
     """Basic sanitization: remove code fences/backticks, URLs, emails, excessive whitespace.
@@ -8,11 +19,38 @@ def sanitize_input(text: str, max_len: int) -> str:
     if not text:
         return text
     cleaned = text
-    cleaned = re.sub(r"```[\s\S]*?```", " ", cleaned)
-    cleaned = cleaned.replace("`", " ")
-    cleaned = re.sub(r"https?://\S+", " ", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\b[\w\.-]+@[\w\.-]+\.[A-Za-z]{2,}\b", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    # Skip the regex pass when its anchor characters are absent, as in most model output
+    if "`" in cleaned or "://" in cleaned or "@" in cleaned:
+        cleaned = _SCRUB_RE.sub(" ", cleaned)
+    # Collapse whitespace runs and trim, same as re.sub(r"\s+", " ", ...).strip()
+    cleaned = " ".join(cleaned.split())
     if len(cleaned) > max_len:
         cleaned = cleaned[:max_len]
-    return cleaned 
\ No newline at end of file
+    return cleaned
+
+
+@functools.lru_cache(maxsize=None)
+def _gpt4_encoding():
+    """Load the GPT-4 tokenizer once; None (also cached) if it cannot be loaded."""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-4")
+    except Exception as e:
+        logger.warning(f"Cannot load tokenizer, token truncation disabled: {e}")
+        return None
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Clamp text to max_tokens GPT-4 tokens, cutting on a token boundary.
+    Returns the text unchanged if the tokenizer is unavailable.
+    """
+    # Every token covers at least one byte, so short text needs no encoding
+    if not text or len(text.encode("utf-8")) <= max_tokens:
+        return text
+    encoding = _gpt4_encoding()
+    if encoding is None:
+        return text
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])